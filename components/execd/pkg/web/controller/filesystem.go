@@ -476,8 +476,16 @@ func (c *FilesystemController) ReplaceContent() {
 		}
 
 		if verbose {
+			// Report the post-write size and mtime so callers need no follow-up stat.
+			written, err := os.Stat(file)
+			if err != nil {
+				c.handleFileError(err)
+				return
+			}
 			results[origPath] = model.ReplaceFileContentResult{
 				ReplacedCount: strings.Count(contentStr, item.Old),
+				Size:          written.Size(),
+				ModifiedAt:    written.ModTime(),
 			}
 		}
 	}
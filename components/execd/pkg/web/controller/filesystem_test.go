@@ -15,13 +15,16 @@
 package controller
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
+	"mime/multipart"
 	"net/http"
 	"net/http/httptest"
 	"net/url"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/alibaba/opensandbox/execd/pkg/web/model"
@@ -334,6 +337,96 @@ func TestFilesystemControllerReplaceContent(t *testing.T) {
 	require.Equal(t, "hello universe", string(data))
 }
 
+func TestFilesystemControllerReplaceContentVerboseReturnsMetadata(t *testing.T) {
+	target := filepath.Join(t.TempDir(), "content.txt")
+	require.NoError(t, os.WriteFile(target, []byte("hello world world"), 0o644))
+
+	body, err := json.Marshal(map[string]model.ReplaceFileContentItem{
+		target: {Old: "world", New: "x"},
+	})
+	require.NoError(t, err)
+
+	ctrl, rec := newFilesystemController(t, http.MethodPost, "/files/replace?verbose=true", body)
+
+	ctrl.ReplaceContent()
+
+	require.Equal(t, http.StatusOK, rec.Code)
+	var resp map[string]model.ReplaceFileContentResult
+	require.NoError(t, json.Unmarshal(rec.Body.Bytes(), &resp))
+	result, ok := resp[target]
+	require.True(t, ok, "response missing entry for %s", target)
+	require.Equal(t, 2, result.ReplacedCount)
+	require.EqualValues(t, len("hello x x"), result.Size)
+	stat, err := os.Stat(target)
+	require.NoError(t, err)
+	require.True(t, stat.ModTime().Equal(result.ModifiedAt))
+}
+
+func newUploadController(t *testing.T, rawURL, target, content string) (*FilesystemController, *httptest.ResponseRecorder) {
+	t.Helper()
+	var body bytes.Buffer
+	writer := multipart.NewWriter(&body)
+	meta, err := json.Marshal(model.FileMetadata{Path: target, Permission: model.Permission{Mode: 644}})
+	require.NoError(t, err)
+	part, err := writer.CreateFormFile("metadata", "metadata")
+	require.NoError(t, err)
+	_, err = part.Write(meta)
+	require.NoError(t, err)
+	part, err = writer.CreateFormFile("file", filepath.Base(target))
+	require.NoError(t, err)
+	_, err = part.Write([]byte(content))
+	require.NoError(t, err)
+	require.NoError(t, writer.Close())
+
+	ctrl, rec := newFilesystemController(t, http.MethodPost, rawURL, body.Bytes())
+	ctrl.ctx.Request.Header.Set("Content-Type", writer.FormDataContentType())
+	return ctrl, rec
+}
+
+func TestFilesystemControllerUploadFile(t *testing.T) {
+	target := filepath.Join(t.TempDir(), "upload.txt")
+	ctrl, rec := newUploadController(t, "/files/upload", target, "demo")
+
+	ctrl.UploadFile()
+
+	require.Equal(t, http.StatusOK, rec.Code)
+	require.Empty(t, rec.Body.Bytes())
+	data, err := os.ReadFile(target)
+	require.NoError(t, err)
+	require.Equal(t, "demo", string(data))
+}
+
+func TestFilesystemControllerUploadLargeFileKeepsExactSize(t *testing.T) {
+	target := filepath.Join(t.TempDir(), "large.bin")
+	content := strings.Repeat("x", uploadPreallocateThreshold+123)
+	ctrl, rec := newUploadController(t, "/files/upload", target, content)
+
+	ctrl.UploadFile()
+
+	require.Equal(t, http.StatusOK, rec.Code)
+	data, err := os.ReadFile(target)
+	require.NoError(t, err)
+	require.Len(t, data, len(content))
+	require.Equal(t, content, string(data))
+}
+
+func TestFilesystemControllerUploadFileVerboseReturnsInfo(t *testing.T) {
+	target := filepath.Join(t.TempDir(), "upload.txt")
+	ctrl, rec := newUploadController(t, "/files/upload?verbose=true", target, "demo")
+
+	ctrl.UploadFile()
+
+	require.Equal(t, http.StatusOK, rec.Code)
+	var resp map[string]model.FileInfo
+	require.NoError(t, json.Unmarshal(rec.Body.Bytes(), &resp))
+	info, ok := resp[target]
+	require.True(t, ok, "response missing entry for %s", target)
+	require.Equal(t, "file", info.Type)
+	require.EqualValues(t, 4, info.Size)
+	require.Equal(t, 644, info.Mode)
+	require.False(t, info.ModifiedAt.IsZero())
+}
+
 func TestFilesystemControllerReplaceContentSupportsHomePath(t *testing.T) {
 	home := t.TempDir()
 	t.Setenv("HOME", home)
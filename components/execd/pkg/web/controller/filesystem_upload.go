@@ -29,6 +29,11 @@ import (
 	"github.com/alibaba/opensandbox/execd/pkg/web/model"
 )
 
+// uploadPreallocateThreshold is the part size from which the destination
+// file is preallocated before copying; smaller files gain nothing from the
+// extra syscall.
+const uploadPreallocateThreshold = 1 << 20
+
 type uploadError struct {
 	status  int
 	code    model.ErrorCode
@@ -44,20 +49,41 @@ func (c *FilesystemController) UploadFile() {
 	rec := beginFilesystemMetric("upload")
 	defer rec.Finish(c.basicController)
 
+	verbose := c.ctx.Query("verbose") == "true"
+
 	metadataParts, fileParts, uerr := c.parseUploadForm()
 	if uerr != nil {
 		c.RespondError(uerr.status, uerr.code, uerr.message)
 		return
 	}
 
+	var infos map[string]model.FileInfo
+	if verbose {
+		infos = make(map[string]model.FileInfo, len(metadataParts))
+	}
+
 	for i := range metadataParts {
-		if uerr := c.processUploadPair(metadataParts[i], fileParts[i]); uerr != nil {
+		meta, resolvedPath, uerr := c.processUploadPair(metadataParts[i], fileParts[i])
+		if uerr != nil {
 			c.RespondError(uerr.status, uerr.code, uerr.message)
 			return
 		}
+		if verbose {
+			// Stat the file we just wrote so callers can skip a follow-up /files/info.
+			info, err := GetFileInfo(resolvedPath)
+			if err != nil {
+				c.handleFileError(err)
+				return
+			}
+			infos[meta.Path] = info
+		}
 	}
 
 	rec.MarkSuccess()
+	if verbose {
+		c.RespondSuccess(infos)
+		return
+	}
 	c.RespondSuccess(nil)
 }
 
@@ -86,22 +112,27 @@ func (c *FilesystemController) parseUploadForm() ([]*multipart.FileHeader, []*mu
 	return metadataParts, fileParts, nil
 }
 
-func (c *FilesystemController) processUploadPair(metadataHeader, fileHeader *multipart.FileHeader) *uploadError {
+func (c *FilesystemController) processUploadPair(
+	metadataHeader, fileHeader *multipart.FileHeader,
+) (*model.FileMetadata, string, *uploadError) {
 	meta, uerr := parseUploadMetadata(metadataHeader)
 	if uerr != nil {
-		return uerr
+		return nil, "", uerr
 	}
 
 	resolvedPath, uerr := resolveUploadTarget(meta.Path)
 	if uerr != nil {
-		return uerr
+		return nil, "", uerr
 	}
 
 	if uerr := writeUploadFile(resolvedPath, fileHeader); uerr != nil {
-		return uerr
+		return nil, "", uerr
 	}
 
-	return applyUploadPermission(resolvedPath, meta.Permission)
+	if uerr := applyUploadPermission(resolvedPath, meta.Permission); uerr != nil {
+		return nil, "", uerr
+	}
+	return meta, resolvedPath, nil
 }
 
 func parseUploadMetadata(header *multipart.FileHeader) (*model.FileMetadata, *uploadError) {
@@ -177,6 +208,12 @@ func writeUploadFile(resolvedPath string, fileHeader *multipart.FileHeader) *upl
 		)
 	}
 
+	if fileHeader.Size >= uploadPreallocateThreshold {
+		if err := preallocateFile(dst, fileHeader.Size); err != nil {
+			log.Warning("failed to preallocate %s: %v", resolvedPath, err)
+		}
+	}
+
 	if _, err := io.Copy(dst, file); err != nil {
 		dst.Close()
 		return newUploadError(
@@ -18,9 +18,12 @@
 package controller
 
 import (
+	"errors"
 	"os"
 	"syscall"
 	"time"
+
+	"golang.org/x/sys/unix"
 )
 
 func getFileCreateTime(fileInfo os.FileInfo) time.Time {
@@ -31,3 +34,15 @@ func getFileCreateTime(fileInfo os.FileInfo) time.Time {
 
 	return time.Unix(stat.Ctim.Sec, stat.Ctim.Nsec)
 }
+
+// preallocateFile reserves disk blocks for size bytes without changing the
+// file length, so a large upload is laid out in one go instead of the file
+// growing extent by extent. Filesystems without fallocate support are not
+// an error; the copy simply proceeds unreserved.
+func preallocateFile(f *os.File, size int64) error {
+	err := unix.Fallocate(int(f.Fd()), unix.FALLOC_FL_KEEP_SIZE, 0, size)
+	if errors.Is(err, unix.EOPNOTSUPP) || errors.Is(err, unix.ENOSYS) {
+		return nil
+	}
+	return err
+}
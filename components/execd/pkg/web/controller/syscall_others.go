@@ -25,3 +25,7 @@ import (
 func getFileCreateTime(_ os.FileInfo) time.Time {
 	return time.Now()
 }
+
+func preallocateFile(_ *os.File, _ int64) error {
+	return nil
+}
@@ -52,5 +52,7 @@ type ReplaceFileContentItem struct {
 
 // ReplaceFileContentResult represents the result of a content replacement on a single file
 type ReplaceFileContentResult struct {
-	ReplacedCount int `json:"replacedCount"`
+	ReplacedCount int       `json:"replacedCount"`
+	Size          int64     `json:"size"`
+	ModifiedAt    time.Time `json:"modified_at"`
 }
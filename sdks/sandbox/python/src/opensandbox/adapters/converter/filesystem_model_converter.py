@@ -24,6 +24,8 @@ This converter is designed to work with openapi-python-client generated models.
 
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from opensandbox.api.execd.models import FileInfo
 from opensandbox.api.execd.types import UNSET
 from opensandbox.models.filesystem import (
@@ -35,6 +37,10 @@ from opensandbox.models.filesystem import (
     WriteEntry,
 )
 
+# Decodes a JSON path -> FileInfo map straight into EntryInfo in pydantic-core,
+# without building intermediate dicts or generated FileInfo objects.
+_ENTRY_INFO_MAP_ADAPTER = TypeAdapter(dict[str, EntryInfo])
+
 
 class FilesystemModelConverter:
     """
@@ -89,6 +95,13 @@ class FilesystemModelConverter:
 
         return result
 
+    @staticmethod
+    def to_entry_info_map_from_json(content: bytes | str) -> dict[str, EntryInfo]:
+        """Decode a raw JSON map of path to FileInfo into a map of path to EntryInfo."""
+        if not content:
+            return {}
+        return _ENTRY_INFO_MAP_ADAPTER.validate_json(content)
+
     @staticmethod
     def to_api_make_dirs_body(entries: list[WriteEntry]):
         """Convert directory entries to MakeDirsBody."""
@@ -148,13 +161,28 @@ class FilesystemModelConverter:
             items = api_response
 
         for path, result_data in items.items():
+            size = None
+            modified_at = None
             if hasattr(result_data, "replaced_count"):
                 count = result_data.replaced_count
+                if getattr(result_data, "size", UNSET) is not UNSET:
+                    size = result_data.size
+                if getattr(result_data, "modified_at", UNSET) is not UNSET:
+                    modified_at = result_data.modified_at
             elif isinstance(result_data, dict):
                 count = result_data.get("replacedCount", 0)
+                size = result_data.get("size")
+                modified_at = result_data.get("modified_at")
             else:
                 count = 0
-            results.append(ContentReplaceResult(path=path, replaced_count=count))
+            results.append(
+                ContentReplaceResult(
+                    path=path,
+                    replaced_count=count,
+                    size=size,
+                    modified_at=modified_at,
+                )
+            )
 
         return results
 
@@ -20,6 +20,7 @@ Implementation of FilesystemService that adapts openapi-python-client generated
 This adapter handles file operations within sandboxes using the auto-generated API client.
 """
 
+import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
@@ -28,6 +29,7 @@ from typing import TypedDict
 
 import httpx
 
+from opensandbox.adapters.converter.buffer_reader import BufferReader
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
@@ -39,13 +41,18 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
 )
 from opensandbox.config import ConnectionConfig
-from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
+from opensandbox.exceptions import (
+    InvalidArgumentException,
+    SandboxApiException,
+    SandboxException,
+)
 from opensandbox.models.filesystem import (
     ContentReplaceEntry,
     ContentReplaceResult,
     DirectoryListEntry,
     EntryInfo,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
@@ -183,6 +190,25 @@ class FilesystemAdapter(Filesystem):
             logger.error(f"Failed to read file {path}", exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    async def read_many(self, entries: list[ReadEntry]) -> list[bytes]:
+        """Read several files concurrently; results keep the order of ``entries``."""
+        if not entries:
+            return []
+        logger.debug(f"Reading {len(entries)} files concurrently")
+        return list(
+            await asyncio.gather(
+                *(
+                    self.read_bytes(
+                        entry.path,
+                        range_header=entry.range_header,
+                        offset=entry.offset,
+                        limit=entry.limit,
+                    )
+                    for entry in entries
+                )
+            )
+        )
+
     async def read_bytes_stream(
             self,
             path: str,
@@ -234,7 +260,31 @@ class FilesystemAdapter(Filesystem):
         """
         if not entries:
             return
+        await self._upload_files(entries, verbose=False)
 
+    async def write_files_detailed(self, entries: list[WriteEntry]) -> dict[str, EntryInfo]:
+        """Write files and return the metadata of each written file from the same request."""
+        if not entries:
+            return {}
+        response = await self._upload_files(entries, verbose=True)
+        paths = [entry.path for entry in entries]
+        try:
+            infos = FilesystemModelConverter.to_entry_info_map_from_json(response.content)
+        except ValueError:
+            infos = {}
+        if not infos:
+            # execd without verbose upload support answers 200 with an empty body.
+            logger.debug("Upload response carried no file info; falling back to get_file_info")
+            infos = await self.get_file_info(paths)
+        missing = [path for path in paths if path not in infos]
+        if missing:
+            raise SandboxException(
+                f"No file info returned for written files: {', '.join(missing)}",
+                request_id=extract_request_id(response.headers),
+            )
+        return infos
+
+    async def _upload_files(self, entries: list[WriteEntry], *, verbose: bool) -> httpx.Response:
         logger.debug(f"Writing {len(entries)} files")
 
         try:
@@ -259,13 +309,17 @@ class FilesystemAdapter(Filesystem):
                     ("metadata", ("metadata", metadata_json, "application/json"))
                 )
 
-                content: bytes | str | IOBase
+                content: bytes | str | IOBase | BufferReader
                 content_type: str
 
                 if isinstance(entry.data, bytes):
                     content = entry.data
                     content_type = "application/octet-stream"
 
+                elif isinstance(entry.data, (bytearray, memoryview)):
+                    content = BufferReader(entry.data)
+                    content_type = "application/octet-stream"
+
                 elif isinstance(entry.data, str):
                     encoding = entry.encoding or "utf-8"
                     content = entry.data
@@ -286,8 +340,10 @@ class FilesystemAdapter(Filesystem):
                 multipart_parts.append(("file", (entry.path, content, content_type)))
 
             url = self._get_execd_url(self.FILESYSTEM_UPLOAD_PATH)
-            response = await client.post(url, files=multipart_parts)
+            params = {"verbose": "true"} if verbose else None
+            response = await client.post(url, files=multipart_parts, params=params)
             response.raise_for_status()
+            return response
         except Exception as e:
             logger.error(f"Failed to write {len(entries)} files", exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
@@ -295,7 +351,7 @@ class FilesystemAdapter(Filesystem):
     async def write_file(
         self,
         path: str,
-        data: str | bytes | IOBase,
+        data: str | bytes | bytearray | memoryview | IOBase,
         *,
         encoding: str = "utf-8",
         mode: int = 755,
@@ -16,11 +16,15 @@
 
 from __future__ import annotations
 
+import datetime
 from collections.abc import Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
+from dateutil.parser import isoparse
+
+from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ReplaceFileContentResult")
 
@@ -31,14 +35,25 @@ class ReplaceFileContentResult:
 
     Attributes:
         replaced_count (int): Number of occurrences replaced. 0 means oldContent was not found in the file. Example: 1.
+        size (int | Unset): File size in bytes after the replacement Example: 2048.
+        modified_at (datetime.datetime | Unset): Last modification time after the replacement Example:
+            2025-11-16T14:30:45Z.
     """
 
     replaced_count: int
+    size: int | Unset = UNSET
+    modified_at: datetime.datetime | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         replaced_count = self.replaced_count
 
+        size = self.size
+
+        modified_at: str | Unset = UNSET
+        if not isinstance(self.modified_at, Unset):
+            modified_at = self.modified_at.isoformat()
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -46,6 +61,10 @@ class ReplaceFileContentResult:
                 "replacedCount": replaced_count,
             }
         )
+        if size is not UNSET:
+            field_dict["size"] = size
+        if modified_at is not UNSET:
+            field_dict["modified_at"] = modified_at
 
         return field_dict
 
@@ -54,8 +73,19 @@ class ReplaceFileContentResult:
         d = dict(src_dict)
         replaced_count = d.pop("replacedCount")
 
+        size = d.pop("size", UNSET)
+
+        _modified_at = d.pop("modified_at", UNSET)
+        modified_at: datetime.datetime | Unset
+        if isinstance(_modified_at, Unset):
+            modified_at = UNSET
+        else:
+            modified_at = isoparse(_modified_at)
+
         replace_file_content_result = cls(
             replaced_count=replaced_count,
+            size=size,
+            modified_at=modified_at,
         )
 
         replace_file_content_result.additional_properties = d
@@ -37,6 +37,7 @@ from opensandbox.models.filesystem import (
     DirectoryListEntry,
     EntryInfo,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
@@ -91,6 +92,7 @@ __all__ = [
     # Filesystem models
     "EntryInfo",
     "WriteEntry",
+    "ReadEntry",
     "MoveEntry",
     "DirectoryListEntry",
     "SetPermissionEntry",
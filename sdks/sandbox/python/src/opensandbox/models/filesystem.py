@@ -58,8 +58,9 @@ class WriteEntry(BaseModel):
     """
 
     path: str = Field(description="Destination file path where content will be written")
-    data: str | bytes | IOBase | None = Field(
-        default=None, description="Content to write - can be str or bytes"
+    data: str | bytes | bytearray | memoryview | IOBase | None = Field(
+        default=None,
+        description="Content to write - str, a bytes-like object, or a binary stream",
     )
     mode: int = Field(default=755, description="Unix file permissions as integer")
     owner: str | None = Field(default=None, description="Owner username to set")
@@ -91,6 +92,33 @@ class WriteEntry(BaseModel):
         return v
 
 
+class ReadEntry(BaseModel):
+    """
+    Request to read a file, or part of one, as bytes.
+
+    ``range_header`` and ``offset``/``limit`` are mutually exclusive, as in
+    ``read_bytes``.
+    """
+
+    path: str = Field(description="Path of the file to read")
+    range_header: str | None = Field(
+        default=None, description="HTTP byte range to read (e.g., \"bytes=0-1023\")"
+    )
+    offset: int | None = Field(
+        default=None, description="Starting line number (1-based) for line-based reading"
+    )
+    limit: int | None = Field(
+        default=None, description="Number of lines to return for line-based reading"
+    )
+
+    @field_validator("path")
+    @classmethod
+    def path_must_not_be_empty(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("Path cannot be blank")
+        return v
+
+
 class DirectoryListEntry(BaseModel):
     """Request to list directory contents with optional depth control."""
 
@@ -208,6 +236,10 @@ class ContentReplaceResult(BaseModel):
 
     path: str = Field(description="File path where replacement was performed")
     replaced_count: int = Field(description="Number of occurrences replaced. 0 means old content was not found.")
+    size: int | None = Field(default=None, description="File size in bytes after the replacement")
+    modified_at: datetime | None = Field(
+        default=None, description="Timestamp when the file was modified by the replacement"
+    )
 
 
 class SearchEntry(BaseModel):
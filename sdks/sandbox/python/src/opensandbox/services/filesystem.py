@@ -28,6 +28,7 @@ from opensandbox.models.filesystem import (
     DirectoryListEntry,
     EntryInfo,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
@@ -101,6 +102,25 @@ class Filesystem(Protocol):
         """
         ...
 
+    async def read_many(self, entries: list[ReadEntry]) -> list[bytes]:
+        """
+        Read several files (or parts of files) as bytes concurrently.
+
+        The reads are independent requests issued in parallel over the shared
+        connection pool, so the total latency is roughly that of the slowest read
+        instead of the sum.
+
+        Args:
+            entries: Read requests; the same path may appear more than once.
+
+        Returns:
+            File contents in the same order as ``entries``.
+
+        Raises:
+            SandboxException: if any read fails
+        """
+        ...
+
     async def read_bytes_stream(
         self,
         path: str,
@@ -127,10 +147,29 @@ class Filesystem(Protocol):
         """
         ...
 
+    async def write_files_detailed(self, entries: list[WriteEntry]) -> dict[str, EntryInfo]:
+        """
+        Write files and return the metadata of each written file.
+
+        The metadata comes back in the upload response, so no follow-up
+        get_file_info request is needed. Against an execd that predates verbose
+        uploads, the metadata is fetched with one get_file_info call instead.
+
+        Args:
+            entries: List of WriteEntry objects specifying files to write and their content
+
+        Returns:
+            Mapping of each written path to its EntryInfo
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        ...
+
     async def write_file(
         self,
         path: str,
-        data: str | bytes | IOBase,
+        data: str | bytes | bytearray | memoryview | IOBase,
         *,
         encoding: str = "utf-8",
         mode: int = 755,
@@ -48,6 +48,7 @@ from opensandbox.sync.adapters.converter.execution_event_dispatcher import (
     ExecutionEventDispatcherSync,
 )
 from opensandbox.sync.services.command import CommandsSync
+from opensandbox.sync.services.command_session import CommandSessionSync
 
 logger = logging.getLogger(__name__)
 
@@ -386,3 +387,6 @@ class CommandsAdapterSync(CommandsSync):
                 handle_api_error(parsed, "delete_session")
         except Exception as e:
             raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    def session(self, *, working_directory: str | None = None) -> CommandSessionSync:
+        return CommandSessionSync(self, working_directory=working_directory)
@@ -20,11 +20,13 @@ Synchronous filesystem service adapter implementation.
 import json
 import logging
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase, TextIOBase
 from typing import TypedDict
 
 import httpx
 
+from opensandbox.adapters.converter.buffer_reader import BufferReader
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
@@ -36,19 +38,25 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
 )
 from opensandbox.config.connection_sync import ConnectionConfigSync
-from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
+from opensandbox.exceptions import (
+    InvalidArgumentException,
+    SandboxApiException,
+    SandboxException,
+)
 from opensandbox.models.filesystem import (
     ContentReplaceEntry,
     ContentReplaceResult,
     DirectoryListEntry,
     EntryInfo,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
 )
 from opensandbox.models.sandboxes import SandboxEndpoint
 from opensandbox.sync.services.filesystem import FilesystemSync
+from opensandbox.sync.services.filesystem_stream import ByteStreamSync
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +69,7 @@ class _DownloadRequest(TypedDict):
 class FilesystemAdapterSync(FilesystemSync):
     FILESYSTEM_UPLOAD_PATH = "/files/upload"
     FILESYSTEM_DOWNLOAD_PATH = "/files/download"
+    READ_MANY_MAX_WORKERS = 8
 
     def __init__(self, connection_config: ConnectionConfigSync, execd_endpoint: SandboxEndpoint) -> None:
         self.connection_config = connection_config
@@ -144,6 +153,28 @@ class FilesystemAdapterSync(FilesystemSync):
             logger.error("Failed to read file %s", path, exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    def read_many(self, entries: list[ReadEntry]) -> list[bytes]:
+        if not entries:
+            return []
+        logger.debug("Reading %s files concurrently", len(entries))
+
+        def _read(entry: ReadEntry) -> bytes:
+            return self.read_bytes(
+                entry.path,
+                range_header=entry.range_header,
+                offset=entry.offset,
+                limit=entry.limit,
+            )
+
+        if len(entries) == 1:
+            return [_read(entries[0])]
+        # httpx.Client is thread-safe; each worker borrows its own pooled connection.
+        with ThreadPoolExecutor(
+            max_workers=min(len(entries), self.READ_MANY_MAX_WORKERS),
+            thread_name_prefix="opensandbox-read",
+        ) as pool:
+            return list(pool.map(_read, entries))
+
     def read_bytes_stream(
         self,
         path: str,
@@ -152,7 +183,7 @@ class FilesystemAdapterSync(FilesystemSync):
         range_header: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
-    ) -> Iterator[bytes]:
+    ) -> ByteStreamSync:
         logger.debug("Streaming file as bytes: %s (chunk_size=%s)", path, chunk_size)
         request_data = self._build_download_request(path, range_header, offset=offset, limit=limit)
         url = request_data["url"]
@@ -184,11 +215,43 @@ class FilesystemAdapterSync(FilesystemSync):
             finally:
                 response.close()
 
-        return _iter()
+        # Content-Length is only the decoded size when no content coding is applied.
+        content_length = None
+        length_header = response.headers.get("Content-Length")
+        if length_header is not None and "Content-Encoding" not in response.headers:
+            try:
+                content_length = int(length_header)
+            except ValueError:
+                content_length = None
+        return ByteStreamSync(_iter(), content_length)
 
     def write_files(self, entries: list[WriteEntry]) -> None:
         if not entries:
             return
+        self._upload_files(entries, verbose=False)
+
+    def write_files_detailed(self, entries: list[WriteEntry]) -> dict[str, EntryInfo]:
+        if not entries:
+            return {}
+        response = self._upload_files(entries, verbose=True)
+        paths = [entry.path for entry in entries]
+        try:
+            infos = FilesystemModelConverter.to_entry_info_map_from_json(response.content)
+        except ValueError:
+            infos = {}
+        if not infos:
+            # execd without verbose upload support answers 200 with an empty body.
+            logger.debug("Upload response carried no file info; falling back to get_file_info")
+            infos = self.get_file_info(paths)
+        missing = [path for path in paths if path not in infos]
+        if missing:
+            raise SandboxException(
+                f"No file info returned for written files: {', '.join(missing)}",
+                request_id=extract_request_id(response.headers),
+            )
+        return infos
+
+    def _upload_files(self, entries: list[WriteEntry], *, verbose: bool) -> httpx.Response:
         logger.debug("Writing %s files", len(entries))
         try:
             multipart_parts = []
@@ -206,11 +269,14 @@ class FilesystemAdapterSync(FilesystemSync):
                 }
                 multipart_parts.append(("metadata", ("metadata", json.dumps(metadata), "application/json")))
 
-                content: bytes | str | IOBase
+                content: bytes | str | IOBase | BufferReader
                 content_type: str
                 if isinstance(entry.data, bytes):
                     content = entry.data
                     content_type = "application/octet-stream"
+                elif isinstance(entry.data, (bytearray, memoryview)):
+                    content = BufferReader(entry.data)
+                    content_type = "application/octet-stream"
                 elif isinstance(entry.data, str):
                     encoding = entry.encoding or "utf-8"
                     content = entry.data
@@ -228,8 +294,10 @@ class FilesystemAdapterSync(FilesystemSync):
                 multipart_parts.append(("file", (entry.path, content, content_type)))
 
             url = self._get_execd_url(self.FILESYSTEM_UPLOAD_PATH)
-            response = self._httpx_client.post(url, files=multipart_parts)
+            params = {"verbose": "true"} if verbose else None
+            response = self._httpx_client.post(url, files=multipart_parts, params=params)
             response.raise_for_status()
+            return response
         except Exception as e:
             logger.error("Failed to write %s files", len(entries), exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
@@ -237,7 +305,7 @@ class FilesystemAdapterSync(FilesystemSync):
     def write_file(
         self,
         path: str,
-        data: str | bytes | IOBase,
+        data: str | bytes | bytearray | memoryview | IOBase,
         *,
         encoding: str = "utf-8",
         mode: int = 755,
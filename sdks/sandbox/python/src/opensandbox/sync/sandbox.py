@@ -416,11 +416,11 @@ class SandboxSync:
             timeout.total_seconds(),
         )
 
-        deadline = time.time() + timeout.total_seconds()
+        deadline = time.monotonic() + timeout.total_seconds()
         attempt = 0
         last_exception: Exception | None = None
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             attempt += 1
             logger.debug("Health check attempt #%s for sandbox %s", attempt, self.id)
             try:
@@ -435,7 +435,9 @@ class SandboxSync:
             except Exception as e:
                 last_exception = e
 
-            time.sleep(polling_interval.total_seconds())
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(polling_interval.total_seconds(), remaining))
 
         error_detail = (
             f"Last error: {last_exception}"
@@ -465,6 +467,61 @@ class SandboxSync:
         logger.error(final_message)
         raise SandboxReadyTimeoutException(final_message)
 
+    def wait_for_state(
+        self,
+        state: str,
+        timeout: timedelta,
+        polling_interval: timedelta = timedelta(milliseconds=200),
+        max_polling_interval: timedelta = timedelta(seconds=2),
+    ) -> SandboxInfo:
+        """
+        Wait for the sandbox lifecycle state to reach ``state``.
+
+        The lifecycle API only exposes state through ``GET /sandboxes/{id}``, so
+        this polls :meth:`get_info` against a monotonic deadline, doubling the
+        interval after each miss up to ``max_polling_interval``. Short
+        transitions such as pause/resume are observed within a few hundred
+        milliseconds without hammering the server on slow ones.
+
+        Args:
+            state: Target lifecycle state (e.g. "Running", "Paused")
+            timeout: Maximum time to wait for the state
+            polling_interval: Initial delay between status queries
+            max_polling_interval: Upper bound for the backoff delay
+
+        Returns:
+            The sandbox info observed in the target state
+
+        Raises:
+            SandboxReadyTimeoutException: if the state is not reached within timeout
+            SandboxException: if status cannot be retrieved
+        """
+        deadline = time.monotonic() + timeout.total_seconds()
+        delay = polling_interval.total_seconds()
+        max_delay = max_polling_interval.total_seconds()
+        attempt = 0
+        while True:
+            attempt += 1
+            info = self.get_info()
+            current = info.status.state
+            logger.debug(
+                "State poll #%s for sandbox %s: %s", attempt, self.id, current
+            )
+            if current == state:
+                return info
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+        final_message = (
+            f"Sandbox {self.id} did not reach state {state} within "
+            f"{timeout.total_seconds()}s ({attempt} polls, last state: {current})"
+        )
+        logger.error(final_message)
+        raise SandboxReadyTimeoutException(final_message)
+
     @classmethod
     def create(
         cls,
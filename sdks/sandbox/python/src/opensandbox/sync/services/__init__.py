@@ -18,14 +18,18 @@ Synchronous service interfaces (Protocols) for the sync SDK.
 """
 
 from opensandbox.sync.services.command import CommandsSync
+from opensandbox.sync.services.command_session import CommandSessionSync
 from opensandbox.sync.services.diagnostics import DiagnosticsSync
 from opensandbox.sync.services.egress import CredentialVaultSync, EgressSync
 from opensandbox.sync.services.filesystem import FilesystemSync
+from opensandbox.sync.services.filesystem_stream import ByteStreamSync
 from opensandbox.sync.services.health import HealthSync
 from opensandbox.sync.services.metrics import MetricsSync
 from opensandbox.sync.services.sandbox import SandboxesSync
 
 __all__ = [
+    "ByteStreamSync",
+    "CommandSessionSync",
     "CommandsSync",
     "CredentialVaultSync",
     "DiagnosticsSync",
@@ -30,6 +30,7 @@ from opensandbox.models.execd import (
     RunCommandOpts,
 )
 from opensandbox.models.execd_sync import ExecutionHandlersSync
+from opensandbox.sync.services.command_session import CommandSessionSync
 
 
 class CommandsSync(Protocol):
@@ -145,3 +146,18 @@ class CommandsSync(Protocol):
     def delete_session(self, session_id: str) -> None:
         """Delete a bash session and release resources."""
         ...
+
+    def session(self, *, working_directory: str | None = None) -> CommandSessionSync:
+        """
+        Open a bash session for a sequence of commands.
+
+        Use it as a context manager: the session is created on entry and deleted on exit,
+        and ``run`` executes each command in the same shell via ``run_in_session``.
+
+        Args:
+            working_directory: Optional initial working directory for the session.
+
+        Returns:
+            A CommandSessionSync bound to this service; not yet open.
+        """
+        ...
@@ -0,0 +1,100 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Persistent bash session handle for the sync command service.
+
+``commands.run`` starts a fresh shell for every command. A session keeps one bash
+process alive inside the sandbox, so a sequence of short commands pays the shell
+start-up once and shares working directory and environment between runs.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from opensandbox.exceptions import InvalidArgumentException
+from opensandbox.models.execd import Execution
+from opensandbox.models.execd_sync import ExecutionHandlersSync
+
+if TYPE_CHECKING:
+    from opensandbox.sync.services.command import CommandsSync
+
+
+class CommandSessionSync:
+    """
+    A bash session opened through ``create_session`` and closed with ``delete_session``.
+
+    Obtain one from ``sandbox.commands.session()`` and use it as a context manager: the
+    session is created when the ``with`` block is entered and deleted when it exits,
+    whether or not the block raised. Commands run in order, one at a time.
+    """
+
+    __slots__ = ("_commands", "_working_directory", "_session_id")
+
+    def __init__(self, commands: CommandsSync, *, working_directory: str | None = None) -> None:
+        self._commands = commands
+        self._working_directory = working_directory
+        self._session_id: str | None = None
+
+    def __enter__(self) -> CommandSessionSync:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def session_id(self) -> str | None:
+        """Server-side session ID, or None while the session is not open."""
+        return self._session_id
+
+    def open(self) -> None:
+        """Create the server-side session. Does nothing if it is already open."""
+        if self._session_id is None:
+            self._session_id = self._commands.create_session(
+                working_directory=self._working_directory
+            )
+
+    def run(
+        self,
+        command: str,
+        *,
+        working_directory: str | None = None,
+        timeout: timedelta | None = None,
+        handlers: ExecutionHandlersSync | None = None,
+    ) -> Execution:
+        """
+        Run ``command`` in this session; see :meth:`CommandsSync.run_in_session`.
+
+        Raises:
+            InvalidArgumentException: If the session is not open.
+        """
+        if self._session_id is None:
+            raise InvalidArgumentException("Command session is not open")
+        return self._commands.run_in_session(
+            self._session_id,
+            command,
+            working_directory=working_directory,
+            timeout=timeout,
+            handlers=handlers,
+        )
+
+    def close(self) -> None:
+        """Delete the server-side session. Safe to call more than once."""
+        session_id, self._session_id = self._session_id, None
+        if session_id is not None:
+            self._commands.delete_session(session_id)
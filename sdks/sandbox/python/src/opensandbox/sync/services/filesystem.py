@@ -20,7 +20,6 @@ Defines the contract for **blocking** filesystem operations inside a sandbox.
 This is the sync counterpart of :mod:`opensandbox.services.filesystem`.
 """
 
-from collections.abc import Iterator
 from io import IOBase
 from typing import Protocol
 
@@ -30,10 +29,12 @@ from opensandbox.models.filesystem import (
     DirectoryListEntry,
     EntryInfo,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
 )
+from opensandbox.sync.services.filesystem_stream import ByteStreamSync
 
 
 class FilesystemSync(Protocol):
@@ -106,6 +107,25 @@ class FilesystemSync(Protocol):
         """
         ...
 
+    def read_many(self, entries: list[ReadEntry]) -> list[bytes]:
+        """
+        Read several files (or parts of files) as bytes concurrently.
+
+        The reads are independent requests issued in parallel over the shared
+        connection pool, so the total latency is roughly that of the slowest read
+        instead of the sum.
+
+        Args:
+            entries: Read requests; the same path may appear more than once.
+
+        Returns:
+            File contents in the same order as ``entries``.
+
+        Raises:
+            SandboxException: if any read fails
+        """
+        ...
+
     def read_bytes_stream(
         self,
         path: str,
@@ -114,7 +134,7 @@ class FilesystemSync(Protocol):
         range_header: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
-    ) -> Iterator[bytes]:
+    ) -> ByteStreamSync:
         """
         Stream file content as bytes chunks (blocking iterator).
 
@@ -123,8 +143,9 @@ class FilesystemSync(Protocol):
             chunk_size: Chunk size in bytes (default: 64KiB).
             range_header: Optional HTTP range header.
 
-        Yields:
-            Byte chunks from the file.
+        Returns:
+            Iterator of byte chunks; call ``read_all()`` on it to join the remaining
+            chunks into one bytes object.
 
         Raises:
             SandboxException: If the operation fails.
@@ -143,10 +164,29 @@ class FilesystemSync(Protocol):
         """
         ...
 
+    def write_files_detailed(self, entries: list[WriteEntry]) -> dict[str, EntryInfo]:
+        """
+        Write files and return the metadata of each written file.
+
+        The metadata comes back in the upload response, so no follow-up
+        get_file_info request is needed. Against an execd that predates verbose
+        uploads, the metadata is fetched with one get_file_info call instead.
+
+        Args:
+            entries: List of WriteEntry objects specifying files to write and their content.
+
+        Returns:
+            Mapping of each written path to its EntryInfo.
+
+        Raises:
+            SandboxException: If the operation fails.
+        """
+        ...
+
     def write_file(
         self,
         path: str,
-        data: str | bytes | IOBase,
+        data: str | bytes | bytearray | memoryview | IOBase,
         *,
         encoding: str = "utf-8",
         mode: int = 755,
@@ -0,0 +1,62 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Chunked download stream returned by the sync filesystem service.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+class ByteStreamSync(Iterator[bytes]):
+    """
+    Iterator over downloaded file chunks.
+
+    Iterating yields chunks as they arrive; :meth:`read_all` drains the rest of the
+    stream into one bytes object. :attr:`content_length` is informational only.
+    """
+
+    __slots__ = ("_chunks", "_content_length")
+
+    def __init__(self, chunks: Iterator[bytes], content_length: int | None = None) -> None:
+        self._chunks = chunks
+        self._content_length = content_length
+
+    @property
+    def content_length(self) -> int | None:
+        """Decoded body size announced by the server, or None if unknown."""
+        return self._content_length
+
+    def __iter__(self) -> ByteStreamSync:
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._chunks)
+
+    def read_all(self) -> bytes:
+        """
+        Consume the remaining chunks and return them as a single bytes object.
+
+        Chunks already taken from the iterator are not included.
+        """
+        return b"".join(self._chunks)
+
+    def close(self) -> None:
+        """Release the underlying HTTP response without draining it."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
@@ -21,7 +21,9 @@ from opensandbox.adapters.health_adapter import HealthAdapter
 from opensandbox.adapters.metrics_adapter import MetricsAdapter
 from opensandbox.adapters.sandboxes_adapter import SandboxesAdapter
 from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
 from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.factory import AdapterFactorySync
 
 
 def test_sandbox_service_adapter_eager_init() -> None:
@@ -48,3 +50,26 @@ async def test_execd_service_adapters_eager_init_and_urls() -> None:
     assert await fs._get_client() is not None
     assert await health._get_client() is not None
     assert await metrics._get_client() is not None
+
+
+def test_sync_adapters_share_one_transport() -> None:
+    # Every sync client of a sandbox must reuse the config transport, so lifecycle,
+    # health and execd calls share one keep-alive pool instead of reconnecting.
+    cfg = ConnectionConfigSync(protocol="http").with_transport_if_missing()
+    endpoint = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+    factory = AdapterFactorySync(cfg)
+
+    services = [
+        factory.create_sandbox_service(),
+        factory.create_filesystem_service(endpoint),
+        factory.create_command_service(endpoint),
+        factory.create_health_service(endpoint),
+        factory.create_metrics_service(endpoint),
+    ]
+    clients = [service._httpx_client for service in services]
+    clients.append(services[2]._sse_client)
+
+    try:
+        assert all(client._transport is cfg.transport for client in clients)
+    finally:
+        cfg.close_transport_if_owned()
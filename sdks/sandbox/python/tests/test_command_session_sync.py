@@ -0,0 +1,90 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import InvalidArgumentException
+from opensandbox.models.execd import Execution
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.command_adapter import CommandsAdapterSync
+from opensandbox.sync.services.command_session import CommandSessionSync
+
+
+class _RecordingCommands:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def create_session(self, *, working_directory=None):
+        self.calls.append(("create_session", working_directory))
+        return "sess-1"
+
+    def run_in_session(self, session_id, command, *, working_directory=None, timeout=None, handlers=None):
+        self.calls.append(("run_in_session", session_id, command, working_directory))
+        return Execution()
+
+    def delete_session(self, session_id):
+        self.calls.append(("delete_session", session_id))
+
+
+def test_session_creates_once_runs_in_order_and_deletes_on_exit() -> None:
+    cmds = _RecordingCommands()
+
+    with CommandSessionSync(cmds, working_directory="/tmp") as sh:
+        assert sh.session_id == "sess-1"
+        sh.run("pwd")
+        sh.run("ls", working_directory="/var")
+
+    assert sh.session_id is None
+    assert cmds.calls == [
+        ("create_session", "/tmp"),
+        ("run_in_session", "sess-1", "pwd", None),
+        ("run_in_session", "sess-1", "ls", "/var"),
+        ("delete_session", "sess-1"),
+    ]
+
+
+def test_session_is_deleted_when_block_raises() -> None:
+    cmds = _RecordingCommands()
+
+    with pytest.raises(RuntimeError):
+        with CommandSessionSync(cmds):
+            raise RuntimeError("boom")
+
+    assert cmds.calls[-1] == ("delete_session", "sess-1")
+
+
+def test_run_requires_open_session_and_close_is_idempotent() -> None:
+    cmds = _RecordingCommands()
+    sh = CommandSessionSync(cmds)
+
+    with pytest.raises(InvalidArgumentException):
+        sh.run("pwd")
+
+    sh.open()
+    sh.close()
+    sh.close()
+    assert cmds.calls == [("create_session", None), ("delete_session", "sess-1")]
+
+
+def test_commands_adapter_session_returns_unopened_handle() -> None:
+    cfg = ConnectionConfigSync(protocol="http")
+    endpoint = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+    adapter = CommandsAdapterSync(cfg, endpoint)
+
+    sh = adapter.session(working_directory="/tmp")
+
+    assert isinstance(sh, CommandSessionSync)
+    assert sh.session_id is None
@@ -233,6 +233,59 @@ def test_filesystem_and_metrics_converters() -> None:
     assert m.cpu_used_percentage == 2.0
 
 
+def test_entry_info_map_from_json_matches_generated_model_path() -> None:
+    import json
+
+    from opensandbox.api.execd.models import GetFilesInfoResponse200
+
+    raw = json.dumps(
+        {
+            "/tmp/a.txt": {
+                "path": "/tmp/a.txt",
+                "type": "file",
+                "size": 4,
+                "modified_at": "2025-01-01T00:00:00Z",
+                "created_at": "2025-01-01T00:00:00Z",
+                "owner": "root",
+                "group": "root",
+                "mode": 644,
+            }
+        }
+    ).encode()
+
+    direct = FilesystemModelConverter.to_entry_info_map_from_json(raw)
+    via_generated = FilesystemModelConverter.to_entry_info_map(
+        GetFilesInfoResponse200.from_dict(json.loads(raw))
+    )
+
+    assert direct == via_generated
+    assert direct["/tmp/a.txt"].entry_type == "file"
+    assert FilesystemModelConverter.to_entry_info_map_from_json(b"") == {}
+
+
+def test_replace_results_carry_size_and_modified_at() -> None:
+    from opensandbox.api.execd.models import ReplaceContentResponse200
+
+    parsed = ReplaceContentResponse200.from_dict(
+        {
+            "/tmp/a.txt": {
+                "replacedCount": 2,
+                "size": 9,
+                "modified_at": "2025-01-01T00:00:00Z",
+            },
+            "/tmp/b.txt": {"replacedCount": 0},
+        }
+    )
+
+    results = {r.path: r for r in FilesystemModelConverter.to_replace_results(parsed)}
+
+    assert results["/tmp/a.txt"].replaced_count == 2
+    assert results["/tmp/a.txt"].size == 9
+    assert results["/tmp/a.txt"].modified_at == datetime.fromisoformat("2025-01-01T00:00:00+00:00")
+    assert results["/tmp/b.txt"].size is None
+    assert results["/tmp/b.txt"].modified_at is None
+
+
 def test_sandbox_model_converter_to_api_create_request_and_renew_tz() -> None:
     from datetime import timezone
 
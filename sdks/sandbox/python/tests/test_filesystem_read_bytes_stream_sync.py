@@ -0,0 +1,58 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import httpx
+
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.filesystem_adapter import FilesystemAdapterSync
+from opensandbox.sync.services import ByteStreamSync
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+_BODY = b"0123456789" * 1000
+
+
+def _adapter(response: httpx.Response) -> FilesystemAdapterSync:
+    cfg = ConnectionConfigSync(
+        protocol="http",
+        transport=httpx.MockTransport(lambda _request: response),
+    )
+    return FilesystemAdapterSync(cfg, _ENDPOINT)
+
+
+def test_read_bytes_stream_read_all_reports_content_length() -> None:
+    adapter = _adapter(httpx.Response(200, content=_BODY))
+
+    stream = adapter.read_bytes_stream("/tmp/a.bin", chunk_size=4096)
+
+    assert isinstance(stream, ByteStreamSync)
+    assert stream.content_length == len(_BODY)
+    assert stream.read_all() == _BODY
+
+
+def test_read_bytes_stream_still_iterates_chunks() -> None:
+    adapter = _adapter(httpx.Response(200, content=_BODY))
+
+    chunks = list(adapter.read_bytes_stream("/tmp/a.bin", chunk_size=4096))
+
+    assert [len(c) for c in chunks] == [4096, 4096, 1808]
+    assert b"".join(chunks) == _BODY
+
+
+def test_byte_stream_read_all_returns_only_remaining_chunks() -> None:
+    stream = ByteStreamSync(iter([b"abc", b"def", b"gh"]), content_length=4)
+
+    assert next(stream) == b"abc"
+    assert stream.read_all() == b"defgh"
@@ -0,0 +1,73 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import httpx
+import pytest
+
+from opensandbox.adapters.filesystem_adapter import FilesystemAdapter
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.filesystem import ReadEntry
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.filesystem_adapter import FilesystemAdapterSync
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+_FILES = {"/tmp/a.txt": b"hello world", "/tmp/b.bin": b"\x00\x01\x02"}
+
+
+def _handle(request: httpx.Request) -> httpx.Response:
+    body = _FILES.get(request.url.params["path"])
+    if body is None:
+        return httpx.Response(404)
+    match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+    if match:
+        start, end = int(match.group(1)), int(match.group(2))
+        return httpx.Response(206, content=body[start : end + 1])
+    return httpx.Response(200, content=body)
+
+
+_ENTRIES = [
+    ReadEntry(path="/tmp/a.txt"),
+    ReadEntry(path="/tmp/a.txt", range_header="bytes=0-4"),
+    ReadEntry(path="/tmp/b.bin"),
+]
+_EXPECTED = [b"hello world", b"hello", b"\x00\x01\x02"]
+
+
+def test_sync_read_many_keeps_entry_order() -> None:
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handle))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+
+    assert adapter.read_many(_ENTRIES) == _EXPECTED
+    assert adapter.read_many([]) == []
+
+
+def test_sync_read_many_raises_when_any_read_fails() -> None:
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handle))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+
+    with pytest.raises(SandboxException):
+        adapter.read_many([ReadEntry(path="/tmp/a.txt"), ReadEntry(path="/tmp/missing")])
+
+
+@pytest.mark.asyncio
+async def test_async_read_many_keeps_entry_order() -> None:
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(_handle))
+    adapter = FilesystemAdapter(cfg, _ENDPOINT)
+
+    assert await adapter.read_many(_ENTRIES) == _EXPECTED
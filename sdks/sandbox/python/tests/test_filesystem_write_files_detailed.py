@@ -0,0 +1,174 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+
+import httpx
+import pytest
+
+from opensandbox.adapters.filesystem_adapter import FilesystemAdapter
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.filesystem import WriteEntry
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.filesystem_adapter import FilesystemAdapterSync
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+_INFO = {
+    "path": "/tmp/a.txt",
+    "type": "file",
+    "size": 4,
+    "modified_at": "2025-01-01T00:00:00Z",
+    "created_at": "2025-01-01T00:00:00Z",
+    "owner": "root",
+    "group": "root",
+    "mode": 644,
+}
+
+
+def _handler(seen: list[httpx.Request]):
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.params.get("verbose") == "true":
+            return httpx.Response(200, json={"/tmp/a.txt": _INFO})
+        return httpx.Response(200)
+
+    return handle
+
+
+def test_sync_write_files_detailed_returns_info_from_upload_response() -> None:
+    seen: list[httpx.Request] = []
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handler(seen)))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+
+    infos = adapter.write_files_detailed([WriteEntry(path="/tmp/a.txt", data="demo", mode=644)])
+
+    assert len(seen) == 1
+    assert seen[0].url.path == "/files/upload"
+    assert infos["/tmp/a.txt"].size == 4
+    assert infos["/tmp/a.txt"].mode == 644
+
+
+def test_sync_write_files_does_not_request_info() -> None:
+    seen: list[httpx.Request] = []
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handler(seen)))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+
+    adapter.write_files([WriteEntry(path="/tmp/a.txt", data="demo")])
+
+    assert len(seen) == 1
+    assert "verbose" not in seen[0].url.params
+
+
+def test_sync_write_files_sends_all_entries_in_one_request() -> None:
+    seen: list[httpx.Request] = []
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handler(seen)))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+
+    adapter.write_files(
+        [
+            WriteEntry(path="/tmp/a.txt", data="a"),
+            WriteEntry(path="/tmp/b.bin", data=b"b"),
+            WriteEntry(path="/tmp/c.bin", data=io.BytesIO(b"c")),
+        ]
+    )
+
+    assert len(seen) == 1
+    body = seen[0].read()
+    assert body.count(b'form-data; name="metadata"') == 3
+    assert body.count(b'form-data; name="file"') == 3
+
+
+def _legacy_handler(seen: list[httpx.Request], infos: dict):
+    """Mimics an execd that ignores ?verbose=true and answers uploads with an empty 200."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/files/info":
+            return httpx.Response(200, json=infos)
+        return httpx.Response(200)
+
+    return handle
+
+
+def test_sync_write_files_detailed_falls_back_to_file_info_on_empty_body() -> None:
+    seen: list[httpx.Request] = []
+    transport = httpx.MockTransport(_legacy_handler(seen, {"/tmp/a.txt": _INFO}))
+    adapter = FilesystemAdapterSync(ConnectionConfigSync(protocol="http", transport=transport), _ENDPOINT)
+
+    infos = adapter.write_files_detailed([WriteEntry(path="/tmp/a.txt", data="demo")])
+
+    assert [r.url.path for r in seen] == ["/files/upload", "/files/info"]
+    assert infos["/tmp/a.txt"].size == 4
+
+
+def test_sync_write_files_detailed_raises_when_a_path_has_no_info() -> None:
+    seen: list[httpx.Request] = []
+    transport = httpx.MockTransport(_legacy_handler(seen, {"/tmp/a.txt": _INFO}))
+    adapter = FilesystemAdapterSync(ConnectionConfigSync(protocol="http", transport=transport), _ENDPOINT)
+
+    with pytest.raises(SandboxException, match="/tmp/b.txt"):
+        adapter.write_files_detailed(
+            [WriteEntry(path="/tmp/a.txt", data="a"), WriteEntry(path="/tmp/b.txt", data="b")]
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_write_files_detailed_falls_back_to_file_info_on_empty_body() -> None:
+    seen: list[httpx.Request] = []
+    transport = httpx.MockTransport(_legacy_handler(seen, {"/tmp/a.txt": _INFO}))
+    adapter = FilesystemAdapter(ConnectionConfig(protocol="http", transport=transport), _ENDPOINT)
+
+    infos = await adapter.write_files_detailed([WriteEntry(path="/tmp/a.txt", data="demo")])
+
+    assert [r.url.path for r in seen] == ["/files/upload", "/files/info"]
+    assert infos["/tmp/a.txt"].owner == "root"
+
+
+@pytest.mark.asyncio
+async def test_async_write_files_detailed_returns_info_from_upload_response() -> None:
+    seen: list[httpx.Request] = []
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(_handler(seen)))
+    adapter = FilesystemAdapter(cfg, _ENDPOINT)
+
+    infos = await adapter.write_files_detailed([WriteEntry(path="/tmp/a.txt", data="demo")])
+
+    assert len(seen) == 1
+    assert seen[0].url.params["verbose"] == "true"
+    assert infos["/tmp/a.txt"].owner == "root"
+
+
+def _body_of_file_part(request: httpx.Request) -> bytes:
+    body = request.read()
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    for part in body.split(b"--" + boundary):
+        if b'name="file"' in part:
+            return part.split(b"\r\n\r\n", 1)[1].rsplit(b"\r\n", 1)[0]
+    raise AssertionError("no file part in upload")
+
+
+def test_sync_write_files_accepts_bytes_like_buffers() -> None:
+    seen: list[httpx.Request] = []
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(_handler(seen)))
+    adapter = FilesystemAdapterSync(cfg, _ENDPOINT)
+    payload = bytearray(b"x" * 100_000)
+
+    adapter.write_files([WriteEntry(path="/tmp/a.txt", data=memoryview(payload)[10:])])
+    adapter.write_files([WriteEntry(path="/tmp/a.txt", data=payload)])
+
+    assert "Content-Length" in seen[0].headers
+    assert _body_of_file_part(seen[0]) == bytes(payload[10:])
+    assert _body_of_file_part(seen[1]) == bytes(payload)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
@@ -191,6 +192,58 @@ async def test_check_ready_timeout_message_includes_troubleshooting_hints() -> N
     assert "ConnectionConfig(use_server_proxy=True)" in message
 
 
+class _StateSequenceServiceStub:
+    def __init__(self, states: list[str]) -> None:
+        self._states = list(states)
+        self.calls = 0
+
+    async def get_sandbox_info(self, sandbox_id) -> SimpleNamespace:
+        self.calls += 1
+        state = self._states.pop(0) if len(self._states) > 1 else self._states[0]
+        return SimpleNamespace(id=sandbox_id, status=SimpleNamespace(state=state))
+
+
+@pytest.mark.asyncio
+async def test_wait_for_state_backs_off_until_state_reached(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+
+    async def _record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("opensandbox.sandbox.asyncio.sleep", _record_sleep)
+
+    service = _StateSequenceServiceStub(["Pausing", "Pausing", "Pausing", "Paused"])
+    sbx = _make_sandbox(health_service=_HealthServiceStub(), sandbox_service=service)
+
+    info = await sbx.wait_for_state(
+        "Paused",
+        timeout=timedelta(seconds=30),
+        polling_interval=timedelta(milliseconds=100),
+        max_polling_interval=timedelta(milliseconds=300),
+    )
+
+    assert info.status.state == "Paused"
+    assert service.calls == 4
+    assert delays == pytest.approx([0.1, 0.2, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_wait_for_state_timeout_reports_last_state() -> None:
+    sbx = _make_sandbox(
+        health_service=_HealthServiceStub(),
+        sandbox_service=_StateSequenceServiceStub(["Pausing"]),
+    )
+
+    with pytest.raises(SandboxReadyTimeoutException) as exc_info:
+        await sbx.wait_for_state(
+            "Paused",
+            timeout=timedelta(seconds=0.01),
+            polling_interval=timedelta(seconds=0),
+        )
+
+    assert "last state: Pausing" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_renew_passes_timezone_aware_utc_datetime() -> None:
     svc = _SandboxServiceStub()
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
@@ -112,6 +113,71 @@ def test_sync_check_ready_timeout_message_includes_troubleshooting_hints() -> No
     assert "ConnectionConfigSync(use_server_proxy=True)" in message
 
 
+def test_sync_check_ready_never_sleeps_past_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    import time
+
+    real_sleep = time.sleep
+    delays: list[float] = []
+
+    def _recording_sleep(seconds: float) -> None:
+        delays.append(seconds)
+        real_sleep(seconds)
+
+    monkeypatch.setattr("opensandbox.sync.sandbox.time.sleep", _recording_sleep)
+
+    sbx = SandboxSync(
+        sandbox_id=str(uuid4()),
+        sandbox_service=_Noop(),
+        filesystem_service=_Noop(),
+        command_service=_Noop(),
+        health_service=_Noop(),
+        metrics_service=_Noop(),
+        egress_service=_EgressServiceStub(),
+        diagnostics_service=_DiagnosticsServiceStub(),
+        connection_config=ConnectionConfigSync(),
+        custom_health_check=lambda _: False,
+    )
+
+    with pytest.raises(SandboxReadyTimeoutException):
+        sbx.check_ready(timeout=timedelta(seconds=0.05), polling_interval=timedelta(seconds=10))
+
+    assert delays
+    assert all(d <= 0.05 for d in delays)
+
+
+def test_sync_wait_for_state_returns_once_state_reached(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("opensandbox.sync.sandbox.time.sleep", delays.append)
+
+    states = ["Resuming", "Resuming", "Running"]
+
+    class _StateService:
+        def get_sandbox_info(self, sandbox_id) -> SimpleNamespace:
+            return SimpleNamespace(id=sandbox_id, status=SimpleNamespace(state=states.pop(0)))
+
+    sbx = SandboxSync(
+        sandbox_id=str(uuid4()),
+        sandbox_service=_StateService(),
+        filesystem_service=_Noop(),
+        command_service=_Noop(),
+        health_service=_Noop(),
+        metrics_service=_Noop(),
+        egress_service=_EgressServiceStub(),
+        diagnostics_service=_DiagnosticsServiceStub(),
+        connection_config=ConnectionConfigSync(),
+    )
+
+    info = sbx.wait_for_state(
+        "Running",
+        timeout=timedelta(seconds=60),
+        polling_interval=timedelta(milliseconds=250),
+    )
+
+    assert info.status.state == "Running"
+    assert states == []
+    assert delays == pytest.approx([0.25, 0.5])
+
+
 def test_sync_get_egress_policy_uses_injected_egress_service() -> None:
     sbx = SandboxSync(
         sandbox_id=str(uuid4()),
@@ -22,6 +22,7 @@ helpers to access the parsed settings throughout the application.
 from __future__ import annotations
 
 import base64
+import copy
 import ipaddress
 import logging
 import os
@@ -29,7 +30,14 @@ import re
 from pathlib import Path
 from typing import Any, ClassVar, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
@@ -289,8 +297,7 @@ class GatewayRouteModeConfig(BaseModel):
         description="Routing mode used by the gateway (wildcard, header, uri).",
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class GatewayConfig(BaseModel):
@@ -434,6 +441,8 @@ class LogConfig(BaseModel):
 class ServerConfig(BaseModel):
     """FastAPI server configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(
         default="0.0.0.0",
         description="Interface bound by the lifecycle API server.",
@@ -520,6 +529,8 @@ class ServerConfig(BaseModel):
 class KubernetesRuntimeConfig(BaseModel):
     """Kubernetes-specific runtime configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     kubeconfig_path: Optional[str] = Field(
         default=None,
         description="Absolute path to the kubeconfig file used for API authentication.",
@@ -662,6 +673,8 @@ class AgentSandboxRuntimeConfig(BaseModel):
 class StorageConfig(BaseModel):
     """Volume and storage configuration for sandbox mounts."""
 
+    model_config = ConfigDict(frozen=True)
+
     allowed_host_paths: list[str] = Field(
         default_factory=list,
         description=(
@@ -686,6 +699,11 @@ class StorageConfig(BaseModel):
         ),
     )
 
+
+# Shared defaults for AppConfig blocks omitted from the config; both models are
+# frozen, so one validated instance can back every AppConfig.
+_DEFAULT_STORAGE = StorageConfig()
+
 DEFAULT_EGRESS_DISABLE_IPV6 = True
 
 class EgressConfig(BaseModel):
@@ -716,6 +734,8 @@ class EgressConfig(BaseModel):
 class RuntimeConfig(BaseModel):
     """Runtime selection (docker, kubernetes, etc.)."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["docker", "kubernetes"] = Field(
         ...,
         description="Active sandbox runtime implementation.",
@@ -855,6 +875,9 @@ class StoreConfig(BaseModel):
     )
 
 
+_DEFAULT_K8S = KubernetesRuntimeConfig()
+
+
 class AppConfig(BaseModel):
     """Root application configuration model."""
 
@@ -872,7 +895,7 @@ class AppConfig(BaseModel):
     agent_sandbox: Optional["AgentSandboxRuntimeConfig"] = None
     ingress: Optional[IngressConfig] = None
     docker: DockerConfig = Field(default_factory=DockerConfig)
-    storage: StorageConfig = Field(default_factory=StorageConfig)
+    storage: StorageConfig = Field(default_factory=lambda: _DEFAULT_STORAGE)
     store: StoreConfig = Field(
         default_factory=StoreConfig,
         description="Persistence backend configuration for server-managed resources.",
@@ -895,7 +918,7 @@ class AppConfig(BaseModel):
                 raise ValueError( "secure_runtime.type 'firecracker' is only compatible with runtime.type='kubernetes'.")
         elif self.runtime.type == "kubernetes":
             if self.kubernetes is None:
-                self.kubernetes = KubernetesRuntimeConfig()
+                self.kubernetes = _DEFAULT_K8S
             provider_type = (self.kubernetes.workload_provider or "").lower()
             if provider_type == "agent-sandbox":
                 if self.agent_sandbox is None:
@@ -923,6 +946,11 @@ def _resolve_config_path(path: str | Path | None = None) -> Path:
     return DEFAULT_CONFIG_PATH
 
 
+# Newest parsed TOML per path, tagged with the (mtime_ns, size) it was read at. A
+# rewrite changes the tag and replaces the entry, so the cache holds one per path.
+_PARSE_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
 def _load_toml_data(path: Path) -> dict[str, Any]:
     """Load TOML content from file, returning empty dict if file is missing."""
     if not path.exists():
@@ -930,10 +958,16 @@ def _load_toml_data(path: Path) -> dict[str, Any]:
         return {}
 
     try:
-        with path.open("rb") as fh:
-            data = tomllib.load(fh)
-            logger.info("Loaded configuration from %s", path)
-            return data
+        st = path.stat()
+        cached = _PARSE_CACHE.get(str(path))
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            data = cached[2]
+        else:
+            data = tomllib.loads(path.read_bytes().decode("utf-8"))
+            _PARSE_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, data)
+        logger.info("Loaded configuration from %s", path)
+        # Hand out a copy so a caller mutating the result cannot corrupt later loads.
+        return copy.deepcopy(data)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to read config file %s: %s", path, exc)
         raise
@@ -942,7 +976,10 @@ def _load_toml_data(path: Path) -> dict[str, Any]:
 def _apply_env_overrides(config: AppConfig) -> None:
     """Apply environment variable overrides to parsed configuration."""
     if API_KEY_ENV_VAR in os.environ:
-        config.server.api_key = os.environ[API_KEY_ENV_VAR]
+        # ServerConfig is frozen; swap in an updated copy instead of mutating it.
+        config.server = config.server.model_copy(
+            update={"api_key": os.environ[API_KEY_ENV_VAR]}
+        )
 
 
 def load_config(path: str | Path | None = None) -> AppConfig:
@@ -960,20 +997,47 @@ def load_config(path: str | Path | None = None) -> AppConfig:
         ValidationError: If the TOML contents do not match AppConfig schema.
         Exception: For any IO or parsing errors.
     """
-    global _config, _config_path
+    global _config_path
 
     resolved_path = _resolve_config_path(path)
     raw_data = _load_toml_data(resolved_path)
 
+    config = _build_config(raw_data, source=str(resolved_path))
+    _config_path = resolved_path
+    return config
+
+
+def load_config_dict(data: dict[str, Any]) -> AppConfig:
+    """
+    Build configuration from already-parsed TOML data and store it globally.
+
+    Applies the same validation and environment overrides as ``load_config``
+    without touching the filesystem.
+
+    Args:
+        data: Mapping with the same shape as the parsed TOML document.
+
+    Returns:
+        AppConfig: Parsed application configuration.
+
+    Raises:
+        ValidationError: If the data does not match AppConfig schema.
+    """
+    return _build_config(data, source="<dict>")
+
+
+def _build_config(raw_data: dict[str, Any], source: str) -> AppConfig:
+    global _config
+
     try:
-        _config = AppConfig(**raw_data)
+        config = AppConfig(**raw_data)
     except ValidationError as exc:
-        logger.error("Invalid configuration in %s: %s", resolved_path, exc)
+        logger.error("Invalid configuration in %s: %s", source, exc)
         raise
 
-    _apply_env_overrides(_config)
-    _config_path = resolved_path
-    return _config
+    _apply_env_overrides(config)
+    _config = config
+    return config
 
 
 def get_config() -> AppConfig:
@@ -1024,4 +1088,5 @@ __all__ = [
     "get_config",
     "get_config_path",
     "load_config",
+    "load_config_dict",
 ]
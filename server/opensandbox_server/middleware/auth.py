@@ -20,27 +20,32 @@ API keys are configured via config.toml and validated against the OPEN-SANDBOX-A
 """
 
 import re
-from typing import Callable, Optional
+from typing import Optional
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from opensandbox_server.config import AppConfig, get_config
 
 SANDBOX_API_KEY_HEADER = "OPEN-SANDBOX-API-KEY"
+# ASGI servers deliver header names lowercased as bytes; match against this directly.
+_API_KEY_HEADER_RAW = SANDBOX_API_KEY_HEADER.lower().encode("latin-1")
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Middleware for API Key authentication.
 
     Validates the OPEN-SANDBOX-API-KEY header for all requests except health check.
     Returns 401 Unauthorized if authentication fails.
+
+    Implemented as pure ASGI middleware: the header is read straight from
+    ``scope["headers"]`` without building a Request or header mapping.
     """
 
     # Paths that don't require authentication
-    EXEMPT_PATHS = ["/health", "/docs", "/redoc", "/openapi.json"]
+    EXEMPT_PATHS = ("/health", "/docs", "/redoc", "/openapi.json")
 
     # Strict pattern for proxy-to-sandbox: /sandboxes/{id}/proxy/{port}/... with numeric port only.
     # Matches the actual route in proxy.py; rejects path traversal (..) and malformed port.
@@ -53,18 +58,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
             return False
         return bool(AuthMiddleware._PROXY_PATH_RE.match(path))
 
-    def __init__(self, app, config: Optional[AppConfig] = None):
+    def __init__(self, app: ASGIApp, config: Optional[AppConfig] = None):
         """
         Initialize authentication middleware.
 
         Args:
-            app: FastAPI application instance
+            app: Downstream ASGI application
             config: Optional application configuration (for dependency injection)
         """
-        super().__init__(app)
+        self.app = app
         self.config = config or get_config()
         # Read the API key directly from config; suitable for dev/test usage
         self.valid_api_keys = self._load_api_keys()
+        # Header values arrive as latin-1 bytes; encode keys once so each request
+        # is a plain bytes comparison. Keys outside latin-1 can never match a header.
+        self._valid_api_keys_raw = set()
+        for key in self.valid_api_keys:
+            try:
+                self._valid_api_keys_raw.add(key.encode("latin-1"))
+            except UnicodeEncodeError:
+                continue
 
     def _load_api_keys(self) -> set:
         """
@@ -80,36 +93,47 @@ class AuthMiddleware(BaseHTTPMiddleware):
             return {api_key}
         return set()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process each request and validate authentication.
+        Process each HTTP request and validate authentication.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # Skip authentication for exempt paths
-        if any(request.url.path.startswith(path) for path in self.EXEMPT_PATHS):
-            return await call_next(request)
+        if path.startswith(self.EXEMPT_PATHS):
+            await self.app(scope, receive, send)
+            return
 
         # Skip authentication only for the exact proxy-to-sandbox route shape
         # (no path traversal, no loose substring match)
-        if self._is_proxy_path(request.url.path):
-            return await call_next(request)
+        if self._is_proxy_path(path):
+            await self.app(scope, receive, send)
+            return
 
         # If no API keys are configured, skip authentication
         if not self.valid_api_keys:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        # Extract API key from header
-        api_key = request.headers.get(SANDBOX_API_KEY_HEADER)
+        # Extract API key from header (first occurrence wins, as with Request.headers.get)
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == _API_KEY_HEADER_RAW:
+                api_key = value
+                break
 
         # Validate API key
         if not api_key:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={
                     "code": "MISSING_API_KEY",
@@ -117,10 +141,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
                               f"Provide API key via {SANDBOX_API_KEY_HEADER} header.",
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # Enforce strict comparison whenever API keys are configured
-        if self.valid_api_keys and api_key not in self.valid_api_keys:
-            return JSONResponse(
+        if api_key not in self._valid_api_keys_raw:
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={
                     "code": "INVALID_API_KEY",
@@ -128,7 +154,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
                               "Check your API key and try again.",
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # Authentication successful, proceed to next middleware/handler
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
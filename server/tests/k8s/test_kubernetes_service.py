@@ -147,8 +147,12 @@ class TestKubernetesSandboxServiceCreate:
         }
 
         # Override config values
-        k8s_service.app_config.kubernetes.sandbox_create_timeout_seconds = 120
-        k8s_service.app_config.kubernetes.sandbox_create_poll_interval_seconds = 0.5
+        k8s_service.app_config.kubernetes = k8s_service.app_config.kubernetes.model_copy(
+            update={
+                "sandbox_create_timeout_seconds": 120,
+                "sandbox_create_poll_interval_seconds": 0.5,
+            }
+        )
 
         with patch.object(k8s_service, "_wait_for_sandbox_ready", wraps=k8s_service._wait_for_sandbox_ready) as mock_wait:
             await k8s_service.create_sandbox(create_sandbox_request)
@@ -536,7 +540,9 @@ class TestKubernetesSandboxServiceCreate:
     async def test_create_sandbox_rejects_timeout_above_configured_maximum(
         self, k8s_service, create_sandbox_request
     ):
-        k8s_service.app_config.server.max_sandbox_timeout_seconds = 3600
+        k8s_service.app_config.server = k8s_service.app_config.server.model_copy(
+            update={"max_sandbox_timeout_seconds": 3600}
+        )
         create_sandbox_request.timeout = 7200
 
         with pytest.raises(HTTPException) as exc_info:
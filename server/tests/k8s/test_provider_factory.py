@@ -108,7 +108,9 @@ spec:
         gpu: "true"
 """)
 
-        k8s_app_config.kubernetes.batchsandbox_template_file = str(template_file)
+        k8s_app_config.kubernetes = k8s_app_config.kubernetes.model_copy(
+            update={"batchsandbox_template_file": str(template_file)}
+        )
 
         with patch.object(BatchSandboxProvider, '__init__', return_value=None) as mock_init:
             create_workload_provider(PROVIDER_TYPE_BATCHSANDBOX, mock_k8s_client, k8s_app_config)
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+import json
+
+import pytest
 
 from opensandbox_server.config import AppConfig, IngressConfig, RuntimeConfig, ServerConfig
 from opensandbox_server.middleware.auth import AuthMiddleware
@@ -27,92 +28,93 @@ def _app_config_with_api_key() -> AppConfig:
     )
 
 
-def _build_test_app():
-    app = FastAPI()
-    config = _app_config_with_api_key()
-    app.add_middleware(AuthMiddleware, config=config)
-
-    @app.get("/secured")
-    def secured_endpoint():
-        return {"ok": True}
+async def _downstream_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"ok":true}'})
 
-    return app
 
+async def _call_middleware(path: str, headers: list[tuple[bytes, bytes]] | None = None):
+    """Drive AuthMiddleware with a fabricated ASGI scope and return (status, json_body)."""
+    middleware = AuthMiddleware(app=_downstream_app, config=_app_config_with_api_key())
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+    }
 
-def test_auth_middleware_rejects_missing_key():
-    app = _build_test_app()
-    client = TestClient(app)
-    response = client.get("/secured")
-    assert response.status_code == 401
-    assert response.json()["code"] == "MISSING_API_KEY"
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
 
+    messages: list[dict] = []
 
-def test_auth_middleware_accepts_valid_key():
-    app = _build_test_app()
-    client = TestClient(app)
-    response = client.get("/secured", headers={"OPEN-SANDBOX-API-KEY": "secret-key"})
-    assert response.status_code == 200
-    assert response.json() == {"ok": True}
+    async def send(message):
+        messages.append(message)
 
+    await middleware(scope, receive, send)
 
-def test_auth_middleware_skips_validation_for_proxy_to_sandbox():
-    """Proxy-to-sandbox paths must not require API key; server only forwards to sandbox."""
-    app = _build_test_app()
+    status = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return status, json.loads(body)
 
-    @app.get("/sandboxes/{sandbox_id}/proxy/{port}/{full_path:path}")
-    def proxy_echo(sandbox_id: str, port: int, full_path: str):
-        return {"proxied": True, "sandbox_id": sandbox_id, "port": port, "path": full_path}
 
-    client = TestClient(app)
-    # No OPEN-SANDBOX-API-KEY header; should still succeed for proxy path
-    response = client.get("/sandboxes/abc-123/proxy/8080/foo/bar")
-    assert response.status_code == 200
-    assert response.json()["proxied"] is True
-    assert response.json()["sandbox_id"] == "abc-123"
-    assert response.json()["port"] == 8080
-    assert response.json()["path"] == "foo/bar"
+@pytest.mark.asyncio
+async def test_auth_middleware_rejects_missing_key():
+    status, body = await _call_middleware("/secured")
+    assert status == 401
+    assert body["code"] == "MISSING_API_KEY"
 
 
-def test_auth_middleware_v1_proxy_path_exempt():
-    """V1 prefix proxy path is also exempt."""
-    app = _build_test_app()
+@pytest.mark.asyncio
+async def test_auth_middleware_accepts_valid_key():
+    status, body = await _call_middleware(
+        "/secured", headers=[(b"open-sandbox-api-key", b"secret-key")]
+    )
+    assert status == 200
+    assert body == {"ok": True}
 
-    @app.get("/v1/sandboxes/{sandbox_id}/proxy/{port}/{full_path:path}")
-    def proxy_echo(sandbox_id: str, port: int, full_path: str):
-        return {"proxied": True}
 
-    client = TestClient(app)
-    response = client.get("/v1/sandboxes/sid/proxy/443/")
-    assert response.status_code == 200
-    assert response.json()["proxied"] is True
+@pytest.mark.asyncio
+async def test_auth_middleware_rejects_invalid_key():
+    status, body = await _call_middleware(
+        "/secured", headers=[(b"open-sandbox-api-key", b"wrong-key")]
+    )
+    assert status == 401
+    assert body["code"] == "INVALID_API_KEY"
 
 
-def test_auth_middleware_requires_key_for_non_proxy_paths_containing_proxy_and_sandboxes():
-    """Paths that contain both 'proxy' and 'sandboxes' but not in proxy-route shape still require auth."""
-    app = _build_test_app()
+@pytest.mark.asyncio
+async def test_auth_middleware_skips_validation_for_proxy_to_sandbox():
+    """Proxy-to-sandbox paths must not require API key; server only forwards to sandbox."""
+    # No OPEN-SANDBOX-API-KEY header; should still reach the downstream app for proxy path
+    status, body = await _call_middleware("/sandboxes/abc-123/proxy/8080/foo/bar")
+    assert status == 200
+    assert body == {"ok": True}
 
-    @app.get("/proxy/sandboxes/anything")
-    def fake_proxy():
-        return {"reached": True}
 
-    client = TestClient(app)
-    response = client.get("/proxy/sandboxes/anything")
-    assert response.status_code == 401
-    assert response.json()["code"] == "MISSING_API_KEY"
+@pytest.mark.asyncio
+async def test_auth_middleware_v1_proxy_path_exempt():
+    """V1 prefix proxy path is also exempt."""
+    status, body = await _call_middleware("/v1/sandboxes/sid/proxy/443/")
+    assert status == 200
+    assert body == {"ok": True}
 
 
-def test_auth_middleware_requires_key_for_malformed_proxy_port():
-    """Malformed port (non-numeric) must get 401, not 422; limits unauthenticated surface."""
-    app = _build_test_app()
+@pytest.mark.asyncio
+async def test_auth_middleware_requires_key_for_non_proxy_paths_containing_proxy_and_sandboxes():
+    """Paths that contain both 'proxy' and 'sandboxes' but not in proxy-route shape still require auth."""
+    status, body = await _call_middleware("/proxy/sandboxes/anything")
+    assert status == 401
+    assert body["code"] == "MISSING_API_KEY"
 
-    @app.get("/sandboxes/{sandbox_id}/proxy/{port}/{full_path:path}")
-    def proxy_echo(sandbox_id: str, port: int, full_path: str):
-        return {"proxied": True}
 
-    client = TestClient(app)
-    response = client.get("/sandboxes/s1/proxy/not-a-port/x")
-    assert response.status_code == 401
-    assert response.json()["code"] == "MISSING_API_KEY"
+@pytest.mark.asyncio
+async def test_auth_middleware_requires_key_for_malformed_proxy_port():
+    """Malformed port (non-numeric) must get 401, not 422; limits unauthenticated surface."""
+    status, body = await _call_middleware("/sandboxes/s1/proxy/not-a-port/x")
+    assert status == 401
+    assert body["code"] == "MISSING_API_KEY"
 
 
 def test_auth_middleware_is_proxy_path_rejects_traversal():
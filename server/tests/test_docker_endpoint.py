@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from types import MappingProxyType, SimpleNamespace
+
+import docker
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -23,20 +26,24 @@ from opensandbox_server.services.constants import (
 from opensandbox_server.services.docker import DockerSandboxService
 from opensandbox_server.config import AppConfig, RuntimeConfig, DockerConfig, ServerConfig
 
-@pytest.fixture
-def mock_docker_service():
-    """Create a DockerSandboxService with mocked docker client."""
-    # Setup base config
-    config = AppConfig(
-        server=ServerConfig(port=8080, host="0.0.0.0"),
-        runtime=RuntimeConfig(type="docker", execd_image="test/execd:latest"),
-        router=None,
-        docker=DockerConfig(network_mode="bridge"),
-    )
+_BASE_APP_CONFIG = AppConfig(
+    server=ServerConfig(port=8080, host="0.0.0.0"),
+    runtime=RuntimeConfig(type="docker", execd_image="test/execd:latest"),
+    router=None,
+    docker=DockerConfig(network_mode="bridge"),
+)
+
 
-    with patch("docker.from_env") as mock_docker:
-        mock_client = MagicMock()
-        mock_docker.return_value = mock_client
+@pytest.fixture(scope="module")
+def _mock_docker_service_module():
+    """Create one DockerSandboxService with mocked docker client for the whole module."""
+    # Tests mutate the docker block, so hand the service its own copy.
+    config = _BASE_APP_CONFIG.model_copy(deep=True)
+
+    mock_client = MagicMock()
+    # monkeypatch is function-scoped, so use a module-lived MonkeyPatch context.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(docker, "from_env", lambda: mock_client)
 
         # Initialize service
         service = DockerSandboxService(config=config)
@@ -45,67 +52,74 @@ def mock_docker_service():
 
         yield service, mock_client
 
-def test_get_endpoint_host_mode(mock_docker_service):
-    service, mock_client = mock_docker_service
-    service.app_config.docker.network_mode = "host"
-    service.network_mode = "host"
-
-    mock_container = MagicMock()
-    mock_container.attrs = {"State": {"Running": True}}
-    mock_client.containers.list.return_value = [mock_container]
 
-    with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="10.0.0.1"):
-        endpoint = service.get_endpoint("sbx-123", 8080, resolve_internal=False)
-        assert endpoint.endpoint == "10.0.0.1:8080"
-
-    endpoint_internal = service.get_endpoint("sbx-123", 8080, resolve_internal=True)
-    assert endpoint_internal.endpoint == "127.0.0.1:8080"
-
-
-def test_get_endpoint_bridge_http_port(mock_docker_service):
-    service, mock_client = mock_docker_service
+@pytest.fixture
+def mock_docker_service(_mock_docker_service_module):
+    """Reset the shared service's mutable state so each test starts from the base config."""
+    service, mock_client = _mock_docker_service_module
+    mock_client.reset_mock(return_value=True, side_effect=True)
     service.app_config.docker.network_mode = "bridge"
     service.network_mode = "bridge"
-
-    labels = {
-        "opensandbox.io/embedding-proxy-port": "50002",
-        "opensandbox.io/http-port": "50001",
-    }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "172.17.0.5"},
-    }
-    mock_client.containers.list.return_value = [mock_container]
-
-    with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100"):
-        endpoint = service.get_endpoint("sbx-123", 8080, resolve_internal=False)
-
-    assert endpoint.endpoint == "192.168.1.100:50001"
-
-
-def test_get_endpoint_bridge_other_port_via_execd(mock_docker_service):
+    server_cfg = service.app_config.server
+    yield service, mock_client
+    service.app_config.server = server_cfg
+
+
+_RUNNING = MappingProxyType({"Running": True})
+
+# Read-only container attrs shared across parametrized cases; get_endpoint only reads them.
+_ATTRS_HOST = MappingProxyType({"State": _RUNNING})
+_ATTRS_BRIDGE_LABELED = MappingProxyType({
+    "State": _RUNNING,
+    "Config": MappingProxyType({
+        "Labels": MappingProxyType({
+            "opensandbox.io/embedding-proxy-port": "50002",
+            "opensandbox.io/http-port": "50001",
+        }),
+    }),
+    "NetworkSettings": MappingProxyType({"IPAddress": "172.17.0.5"}),
+})
+_ATTRS_BRIDGE_UNLABELED = MappingProxyType({
+    "State": _RUNNING,
+    "NetworkSettings": MappingProxyType({"IPAddress": "10.0.0.5"}),
+})
+
+# (network_mode, attrs, port, resolve_internal, bind_ip, expected_endpoint)
+# bind_ip=None means _resolve_bind_ip is not patched (internal resolution never calls it).
+_GET_ENDPOINT_CASES = [
+    pytest.param("host", _ATTRS_HOST, 8080, False, "10.0.0.1", "10.0.0.1:8080", id="host-external"),
+    pytest.param("host", _ATTRS_HOST, 8080, True, None, "127.0.0.1:8080", id="host-internal"),
+    pytest.param(
+        "bridge", _ATTRS_BRIDGE_LABELED, 8080, False, "192.168.1.100",
+        "192.168.1.100:50001", id="bridge-http-port",
+    ),
+    pytest.param(
+        "bridge", _ATTRS_BRIDGE_LABELED, 6000, False, "192.168.1.100",
+        "192.168.1.100:50002/proxy/6000", id="bridge-other-port-via-execd",
+    ),
+    pytest.param(
+        "bridge", _ATTRS_BRIDGE_UNLABELED, 8080, True, None, "10.0.0.5:8080", id="bridge-internal",
+    ),
+]
+
+
+@pytest.mark.parametrize("mode,attrs,port,internal,bind_ip,expected", _GET_ENDPOINT_CASES)
+def test_get_endpoint(mock_docker_service, mode, attrs, port, internal, bind_ip, expected):
     service, mock_client = mock_docker_service
-    service.app_config.docker.network_mode = "bridge"
-    service.network_mode = "bridge"
-
-    labels = {
-        "opensandbox.io/embedding-proxy-port": "50002",
-        "opensandbox.io/http-port": "50001",
-    }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "172.17.0.5"},
-    }
-    mock_client.containers.list.return_value = [mock_container]
+    service.app_config.docker.network_mode = mode
+    service.network_mode = mode
+    mock_client.containers.list.return_value = [SimpleNamespace(attrs=attrs)]
 
-    with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100"):
-        endpoint = service.get_endpoint("sbx-123", 6000, resolve_internal=False)
+    if bind_ip is None:
+        endpoint = service.get_endpoint("sbx-123", port, resolve_internal=internal)
+    else:
+        with patch(
+            "opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip",
+            return_value=bind_ip,
+        ):
+            endpoint = service.get_endpoint("sbx-123", port, resolve_internal=internal)
 
-    assert endpoint.endpoint == "192.168.1.100:50002/proxy/6000"
+    assert endpoint.endpoint == expected
 
 
 def test_get_endpoint_bridge_egress_port_includes_auth_header(mock_docker_service):
@@ -118,12 +132,13 @@ def test_get_endpoint_bridge_egress_port_includes_auth_header(mock_docker_servic
         "opensandbox.io/http-port": "50001",
         "opensandbox.io/egress-auth-token": "egress-token",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "172.17.0.5"},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": "172.17.0.5"},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100"):
@@ -144,12 +159,13 @@ def test_get_endpoint_bridge_non_egress_port_does_not_include_auth_header(
         SANDBOX_EMBEDDING_PROXY_PORT_LABEL: "50002",
         SANDBOX_EGRESS_AUTH_TOKEN_METADATA_KEY: "egress-token",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "172.17.0.5"},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": "172.17.0.5"},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100"):
@@ -158,22 +174,6 @@ def test_get_endpoint_bridge_non_egress_port_does_not_include_auth_header(
     assert endpoint.endpoint == "192.168.1.100:50002/proxy/44772"
     assert endpoint.headers is None
 
-def test_get_endpoint_bridge_internal_resolution(mock_docker_service):
-    service, mock_client = mock_docker_service
-    service.app_config.docker.network_mode = "bridge"
-    service.network_mode = "bridge"
-
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "NetworkSettings": {"IPAddress": "10.0.0.5"},
-    }
-    mock_client.containers.list.return_value = [mock_container]
-
-    endpoint = service.get_endpoint("sbx-123", 8080, resolve_internal=True)
-    assert endpoint.endpoint == "10.0.0.5:8080"
-
-
 def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_falls_back_to_host_mapped_endpoint(
     mock_docker_service,
 ):
@@ -185,12 +185,13 @@ def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_falls_back_
         SANDBOX_EMBEDDING_PROXY_PORT_LABEL: "50002",
         SANDBOX_EGRESS_AUTH_TOKEN_METADATA_KEY: "egress-token",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": ""},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": ""},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     endpoint = service.get_endpoint("sbx-123", 18080, resolve_internal=True)
@@ -210,12 +211,13 @@ def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_ignores_con
         SANDBOX_EMBEDDING_PROXY_PORT_LABEL: "50002",
         SANDBOX_EGRESS_AUTH_TOKEN_METADATA_KEY: "egress-token",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "10.0.0.5"},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": "10.0.0.5"},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     endpoint = service.get_endpoint("sbx-123", 18080, resolve_internal=True)
@@ -228,8 +230,9 @@ def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_uses_proxy_
     mock_docker_service,
 ):
     service, mock_client = mock_docker_service
-    service.app_config.server.host = "0.0.0.0"
-    service.app_config.server.eip = "203.0.113.10"
+    service.app_config.server = service.app_config.server.model_copy(
+        update={"host": "0.0.0.0", "eip": "203.0.113.10"}
+    )
     service.app_config.docker.network_mode = "bridge"
     service.network_mode = "bridge"
 
@@ -237,12 +240,13 @@ def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_uses_proxy_
         SANDBOX_EMBEDDING_PROXY_PORT_LABEL: "50002",
         SANDBOX_EGRESS_AUTH_TOKEN_METADATA_KEY: "egress-token",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": ""},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": ""},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     endpoint = service.get_endpoint("sbx-123", 18080, resolve_internal=True)
@@ -251,30 +255,27 @@ def test_get_endpoint_bridge_internal_resolution_with_egress_sidecar_uses_proxy_
     assert endpoint.headers is None
 
 
-def test_get_endpoint_bridge_uses_docker_host_ip_when_server_in_container():
+def test_get_endpoint_bridge_uses_docker_host_ip_when_server_in_container(monkeypatch):
     """When server runs in container (host=0.0.0.0), endpoint uses [docker].host_ip."""
-    config = AppConfig(
-        server=ServerConfig(port=8080, host="0.0.0.0"),
-        runtime=RuntimeConfig(type="docker", execd_image="test/execd:latest"),
-        router=None,
-        docker=DockerConfig(network_mode="bridge", host_ip="10.57.1.91"),
+    config = _BASE_APP_CONFIG.model_copy(
+        update={"docker": DockerConfig(network_mode="bridge", host_ip="10.57.1.91")}
     )
-    with patch("docker.from_env") as mock_docker:
-        mock_client = MagicMock()
-        mock_docker.return_value = mock_client
-        service = DockerSandboxService(config=config)
-        service.docker_client = mock_client
+    mock_client = MagicMock()
+    monkeypatch.setattr(docker, "from_env", lambda: mock_client)
+    service = DockerSandboxService(config=config)
+    service.docker_client = mock_client
 
     labels = {
         "opensandbox.io/embedding-proxy-port": "40109",
         "opensandbox.io/http-port": "50001",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {"IPAddress": "172.17.0.5"},
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {"IPAddress": "172.17.0.5"},
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     with patch("opensandbox_server.services.docker.networking._running_inside_docker_container", return_value=True):
@@ -293,15 +294,16 @@ def test_get_endpoint_user_defined_network_external(mock_docker_service):
         "opensandbox.io/embedding-proxy-port": "51000",
         "opensandbox.io/http-port": "51001",
     }
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "Config": {"Labels": labels},
-        "NetworkSettings": {
-            "IPAddress": "",
-            "Networks": {"my-app-net": {"IPAddress": "192.168.100.5"}},
-        },
-    }
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "Config": {"Labels": labels},
+            "NetworkSettings": {
+                "IPAddress": "",
+                "Networks": {"my-app-net": {"IPAddress": "192.168.100.5"}},
+            },
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     with patch("opensandbox_server.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="10.0.1.1"):
@@ -318,18 +320,19 @@ def test_get_endpoint_user_defined_network_internal_prefers_configured_network(m
     service.app_config.docker.network_mode = "my-app-net"
     service.network_mode = "my-app-net"
 
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "State": {"Running": True},
-        "NetworkSettings": {
-            # top-level IPAddress is empty for user-defined networks
-            "IPAddress": "",
-            "Networks": {
-                "bridge": {"IPAddress": "172.17.0.3"},
-                "my-app-net": {"IPAddress": "192.168.100.5"},
+    mock_container = SimpleNamespace(
+        attrs={
+            "State": {"Running": True},
+            "NetworkSettings": {
+                # top-level IPAddress is empty for user-defined networks
+                "IPAddress": "",
+                "Networks": {
+                    "bridge": {"IPAddress": "172.17.0.3"},
+                    "my-app-net": {"IPAddress": "192.168.100.5"},
+                },
             },
-        },
-    }
+        }
+    )
     mock_client.containers.list.return_value = [mock_container]
 
     endpoint = service.get_endpoint("sbx-123", 8080, resolve_internal=True)
@@ -343,16 +346,17 @@ def test_extract_bridge_ip_falls_back_when_named_network_ip_missing(mock_docker_
     service, _ = mock_docker_service
     service.network_mode = "my-app-net"
 
-    mock_container = MagicMock()
-    mock_container.attrs = {
-        "NetworkSettings": {
-            "IPAddress": "",
-            "Networks": {
-                "my-app-net": {"IPAddress": ""},   # empty — simulate container still attaching
-                "bridge": {"IPAddress": "172.17.0.9"},
+    mock_container = SimpleNamespace(
+        attrs={
+            "NetworkSettings": {
+                "IPAddress": "",
+                "Networks": {
+                    "my-app-net": {"IPAddress": ""},   # empty — simulate container still attaching
+                    "bridge": {"IPAddress": "172.17.0.9"},
+                },
             },
-        },
-    }
+        }
+    )
 
     ip = service._extract_bridge_ip(mock_container)
     assert ip == "172.17.0.9"
@@ -14,19 +14,23 @@
 
 import io
 import pathlib
+import posixpath
 import tarfile
 from unittest.mock import MagicMock, patch
 
 from opensandbox_server.config import AppConfig, IngressConfig, RuntimeConfig, ServerConfig
 from opensandbox_server.services.docker import DockerSandboxService
+from opensandbox_server.services.docker.runtime import BOOTSTRAP_PATH, EXECED_INSTALL_PATH
 
 
-def _app_config() -> AppConfig:
-    return AppConfig(
-        server=ServerConfig(),
-        runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
-        ingress=IngressConfig(mode="direct"),
-    )
+_APP_CONFIG = AppConfig(
+    server=ServerConfig(),
+    runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
+    ingress=IngressConfig(mode="direct"),
+)
+
+_EXPECTED_EXECD_PARENT = posixpath.dirname(EXECED_INSTALL_PATH.rstrip("/")) or "/"
+_EXPECTED_BOOTSTRAP_DIR = posixpath.dirname(BOOTSTRAP_PATH)
 
 
 def _extract_bootstrap_script(archive_bytes: bytes) -> str:
@@ -54,8 +58,7 @@ def _read_full_bootstrap_sh() -> bytes:
     return buf.getvalue()
 
 
-@patch("opensandbox_server.services.docker.docker_service.docker")
-def test_install_bootstrap_script_uses_full_bootstrap_sh(mock_docker):
+def test_install_bootstrap_script_uses_full_bootstrap_sh(monkeypatch):
     """Verify _install_bootstrap_script writes the full bootstrap.sh from the cache.
 
     The test pre-populates _bootstrap_script_cache with the real bootstrap.sh
@@ -63,8 +66,8 @@ def test_install_bootstrap_script_uses_full_bootstrap_sh(mock_docker):
     contains features from the full script (MITM CA handling, signal forwarding,
     etc.) that were absent from the old inline-generated shim.
     """
-    mock_docker.from_env.return_value = MagicMock()
-    service = DockerSandboxService(config=_app_config())
+    monkeypatch.setattr("opensandbox_server.services.docker.docker_service.docker", MagicMock())
+    service = DockerSandboxService(config=_APP_CONFIG)
 
     # Pre-populate the cache as _copy_execd_to_container would.
     cache_key = service._normalize_platform_key(None)
@@ -78,7 +81,8 @@ def test_install_bootstrap_script_uses_full_bootstrap_sh(mock_docker):
     ):
         service._install_bootstrap_script(mock_container, "test-sandbox")
 
-    mock_ensure_dir.assert_called_once()
+    mock_ensure_dir.assert_called_once_with(mock_container, _EXPECTED_BOOTSTRAP_DIR, "test-sandbox")
+    assert mock_container.put_archive.call_args.kwargs["path"] == _EXPECTED_BOOTSTRAP_DIR
     archive_bytes = mock_container.put_archive.call_args.kwargs["data"]
     script = _extract_bootstrap_script(archive_bytes)
 
@@ -92,3 +96,17 @@ def test_install_bootstrap_script_uses_full_bootstrap_sh(mock_docker):
     assert 'EXECD="${EXECD:=/opt/opensandbox/execd}"' in script or "EXECD=" in script
     assert 'if [ -z "${EXECD_ENVS:-}" ]; then' in script
     assert 'export EXECD_ENVS' in script
+
+
+def test_copy_execd_to_container_uses_posix_dirname(monkeypatch):
+    monkeypatch.setattr("opensandbox_server.services.docker.docker_service.docker", MagicMock())
+    service = DockerSandboxService(config=_APP_CONFIG)
+    mock_container = MagicMock()
+
+    with patch.object(service, "_fetch_execd_archive", return_value=b"archive"), patch.object(
+        service, "_ensure_directory"
+    ) as mock_ensure_dir, patch.object(service, "_docker_operation"):
+        service._copy_execd_to_container(mock_container, "test-sandbox")
+
+    mock_ensure_dir.assert_called_once_with(mock_container, _EXPECTED_EXECD_PARENT, "test-sandbox")
+    mock_container.put_archive.assert_called_once_with(path=_EXPECTED_EXECD_PARENT, data=b"archive")
@@ -366,7 +366,7 @@ async def test_create_sandbox_rejects_timeout_above_configured_maximum(mock_dock
     mock_docker.from_env.return_value = mock_client
 
     config = _app_config()
-    config.server.max_sandbox_timeout_seconds = 3600
+    config.server = config.server.model_copy(update={"max_sandbox_timeout_seconds": 3600})
     service = DockerSandboxService(config=config)
 
     request = CreateSandboxRequest(
@@ -1536,7 +1536,7 @@ async def test_create_sandbox_windows_profile_injects_runtime_defaults(mock_dock
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:v1.0.19"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:v1.0.19"})
     cfg.docker.network_mode = "bridge"
     service = DockerSandboxService(config=cfg)
     request = CreateSandboxRequest(
@@ -1584,7 +1584,7 @@ async def test_create_sandbox_windows_profile_does_not_require_download_url_over
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:latest"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:latest"})
     service = DockerSandboxService(config=cfg)
     request = CreateSandboxRequest(
         image=ImageSpec(uri="dockurr/windows:latest"),
@@ -1619,7 +1619,7 @@ async def test_create_sandbox_windows_profile_rejects_missing_runtime_devices(mo
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:v1.0.19"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:v1.0.19"})
     cfg.docker.network_mode = "bridge"
     service = DockerSandboxService(config=cfg)
     request = CreateSandboxRequest(
@@ -1658,7 +1658,7 @@ async def test_create_sandbox_windows_profile_rejects_below_minimum_resource_lim
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:v1.0.19"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:v1.0.19"})
     cfg.docker.network_mode = "bridge"
     service = DockerSandboxService(config=cfg)
     request = CreateSandboxRequest(
@@ -1695,7 +1695,7 @@ async def test_create_sandbox_windows_profile_accepts_dockur_demo_like_request(m
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:v1.0.19"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:v1.0.19"})
     cfg.docker.network_mode = "bridge"
     service = DockerSandboxService(config=cfg)
     request = CreateSandboxRequest(
@@ -1749,7 +1749,7 @@ async def test_create_sandbox_windows_profile_with_network_policy_maps_windows_p
     mock_docker.from_env.return_value = mock_client
 
     cfg = _app_config()
-    cfg.runtime.execd_image = "ghcr.io/opensandbox/execd:v1.0.19"
+    cfg.runtime = cfg.runtime.model_copy(update={"execd_image": "ghcr.io/opensandbox/execd:v1.0.19"})
     cfg.docker.network_mode = "bridge"
     cfg.egress = EgressConfig(image="opensandbox/egress:latest")
     service = DockerSandboxService(config=cfg)
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import pytest
+
 from opensandbox_server.config import (
     GatewayConfig,
     GatewayRouteModeConfig,
@@ -23,53 +25,48 @@ from opensandbox_server.config import (
 from opensandbox_server.services.constants import OPEN_SANDBOX_INGRESS_HEADER
 from opensandbox_server.services.helpers import format_ingress_endpoint
 
-
-def test_format_ingress_endpoint_returns_none_when_not_gateway():
-    cfg = IngressConfig(mode=INGRESS_MODE_DIRECT)
-    assert format_ingress_endpoint(cfg, "sid", 8080) is None
-    assert format_ingress_endpoint(None, "sid", 8080) is None
+# Validated once at import; GatewayRouteModeConfig is frozen, so sharing is safe.
+_ROUTE_WILDCARD = GatewayRouteModeConfig(mode="wildcard")
+_ROUTE_HEADER = GatewayRouteModeConfig(mode="header")
+_ROUTE_URI = GatewayRouteModeConfig(mode="uri")
 
 
-def test_format_ingress_endpoint_wildcard():
-    cfg = IngressConfig(
+_CFGS = {
+    "none": None,
+    "direct": IngressConfig(mode=INGRESS_MODE_DIRECT),
+    "wildcard": IngressConfig(
         mode=INGRESS_MODE_GATEWAY,
-        gateway=GatewayConfig(
-            address="*.example.com",
-            route=GatewayRouteModeConfig(mode="wildcard"),
-        ),
-    )
-    endpoint = format_ingress_endpoint(cfg, "sid", 8080)
-    assert endpoint is not None
-    assert endpoint.endpoint == "sid-8080.example.com"
-    assert endpoint.headers is None
-
-
-def test_format_ingress_endpoint_uri():
-    cfg = IngressConfig(
+        gateway=GatewayConfig(address="*.example.com", route=_ROUTE_WILDCARD),
+    ),
+    "uri": IngressConfig(
         mode=INGRESS_MODE_GATEWAY,
-        gateway=GatewayConfig(
-            address="gateway.example.com",
-            route=GatewayRouteModeConfig(mode="uri"),
-        ),
-    )
-    endpoint = format_ingress_endpoint(cfg, "sid", 9000)
-    assert endpoint is not None
-    assert endpoint.endpoint == "gateway.example.com/sid/9000"
-    assert endpoint.headers is None
-
-
-def test_format_ingress_endpoint_header():
-    cfg = IngressConfig(
+        gateway=GatewayConfig(address="gateway.example.com", route=_ROUTE_URI),
+    ),
+    "header": IngressConfig(
         mode=INGRESS_MODE_GATEWAY,
-        gateway=GatewayConfig(
-            address="gateway.example.com",
-            route=GatewayRouteModeConfig(mode="header"),
-        ),
-    )
-    endpoint = format_ingress_endpoint(cfg, "sid", 8080)
+        gateway=GatewayConfig(address="gateway.example.com", route=_ROUTE_HEADER),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "cfg_key,sid,port,expected_endpoint,expected_headers",
+    [
+        ("none", "sid", 8080, None, None),
+        ("direct", "sid", 8080, None, None),
+        ("wildcard", "sid", 8080, "sid-8080.example.com", None),
+        ("uri", "sid", 9000, "gateway.example.com/sid/9000", None),
+        ("header", "sid", 8080, "gateway.example.com", {OPEN_SANDBOX_INGRESS_HEADER: "sid-8080"}),
+    ],
+)
+def test_format_ingress_endpoint(cfg_key, sid, port, expected_endpoint, expected_headers):
+    endpoint = format_ingress_endpoint(_CFGS[cfg_key], sid, port)
+    if expected_endpoint is None:
+        assert endpoint is None
+        return
     assert endpoint is not None
-    assert endpoint.endpoint == "gateway.example.com"
-    assert endpoint.headers == {OPEN_SANDBOX_INGRESS_HEADER: "sid-8080"}
+    assert endpoint.endpoint == expected_endpoint
+    assert endpoint.headers == expected_headers
 
 
 # ============================================================
@@ -82,7 +79,7 @@ def test_format_signed_ingress_endpoint_wildcard():
         mode=INGRESS_MODE_GATEWAY,
         gateway=GatewayConfig(
             address="*.example.com",
-            route=GatewayRouteModeConfig(mode="wildcard"),
+            route=_ROUTE_WILDCARD,
         ),
     )
     endpoint = format_ingress_endpoint(cfg, "sid", 8080, expires_b36="x2qxvk", signature="aabbccddk")
@@ -96,7 +93,7 @@ def test_format_signed_ingress_endpoint_uri():
         mode=INGRESS_MODE_GATEWAY,
         gateway=GatewayConfig(
             address="gateway.example.com",
-            route=GatewayRouteModeConfig(mode="uri"),
+            route=_ROUTE_URI,
         ),
     )
     endpoint = format_ingress_endpoint(cfg, "sid", 9000, expires_b36="x2qxvk", signature="aabbccddk")
@@ -110,7 +107,7 @@ def test_format_signed_ingress_endpoint_header():
         mode=INGRESS_MODE_GATEWAY,
         gateway=GatewayConfig(
             address="gateway.example.com",
-            route=GatewayRouteModeConfig(mode="header"),
+            route=_ROUTE_HEADER,
         ),
     )
     endpoint = format_ingress_endpoint(cfg, "sid", 8080, expires_b36="x2qxvk", signature="aabbccddk")
@@ -125,7 +122,7 @@ def test_format_signed_ingress_endpoint_partial_params_falls_back_to_unsigned():
         mode=INGRESS_MODE_GATEWAY,
         gateway=GatewayConfig(
             address="*.example.com",
-            route=GatewayRouteModeConfig(mode="wildcard"),
+            route=_ROUTE_WILDCARD,
         ),
     )
     endpoint = format_ingress_endpoint(cfg, "sid", 8080, expires_b36="x2qxvk")
@@ -49,20 +49,23 @@ def test_ensure_platform_valid_rejects_unsupported_os():
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail["code"] == SandboxErrorCodes.INVALID_PARAMETER
 
-def test_ensure_metadata_labels_accepts_common_k8s_forms():
-    valid_metadata = {
-        "app": "web",
-        "k8s.io/name": "app-1",
-        "example.com/label": "a.b_c-1",
-        "team": "A1_b-2.c",
-        "empty": "",
-    }
-
-    assert ensure_metadata_labels(valid_metadata) is None
-
-def test_ensure_metadata_labels_allows_none_or_empty():
-    assert ensure_metadata_labels(None) is None
-    assert ensure_metadata_labels({}) is None
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        None,
+        {},
+        {
+            "app": "web",
+            "k8s.io/name": "app-1",
+            "example.com/label": "a.b_c-1",
+            "team": "A1_b-2.c",
+            "empty": "",
+        },
+    ],
+    ids=["none", "empty", "common-k8s-forms"],
+)
+def test_ensure_metadata_labels_accepts(metadata):
+    assert ensure_metadata_labels(metadata) is None
 
 def test_ensure_metadata_labels_rejects_name_too_long():
     """Label name part exceeding 63 characters should be rejected."""
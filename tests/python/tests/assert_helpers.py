@@ -0,0 +1,100 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Assertion helpers shared by the E2E suites.
+
+``tests/conftest.py`` registers this module for pytest's assert rewriting, so the
+asserts below report their operands on failure, and ``__tracebackhide__`` keeps
+the failure pointing at the calling test rather than at the helper.
+"""
+
+import time
+from datetime import datetime
+
+
+def now_ms() -> int:
+    """Current wall-clock time in epoch milliseconds, the unit execd timestamps use."""
+    return int(time.time() * 1000)
+
+
+# assert_recent_timestamp_ms takes a ``now_ms`` keyword, which shadows the function.
+_clock_ms = now_ms
+
+
+def assert_recent_timestamp_ms(
+    ts: int, *, tolerance_ms: int = 60_000, now_ms: int | None = None
+) -> None:
+    """Pass ``now_ms`` to check several timestamps against one clock read."""
+    __tracebackhide__ = True
+    assert isinstance(ts, int)
+    assert ts > 0
+    delta = abs((_clock_ms() if now_ms is None else now_ms) - ts)
+    assert delta <= tolerance_ms, f"timestamp too far from now: delta={delta}ms (ts={ts})"
+
+
+def _to_ms(ts: datetime | int) -> int:
+    """Epoch milliseconds from an ``int`` ms value or a ``datetime``."""
+    if isinstance(ts, int):
+        return ts
+    return int(ts.timestamp() * 1000)
+
+
+def assert_times_close(
+    created_at: datetime | int, modified_at: datetime | int, *, tolerance_ms: int = 2000
+) -> None:
+    """
+    Some filesystems / implementations may report created/modified with slight reordering.
+    We only assert they're close, and rely on explicit update operations to validate mtime.
+    """
+    __tracebackhide__ = True
+    delta_ms = abs(_to_ms(modified_at) - _to_ms(created_at))
+    assert delta_ms <= tolerance_ms, f"created/modified skew too large: {delta_ms}ms"
+
+
+def assert_modified_updated(
+    before: datetime | int,
+    after: datetime | int,
+    *,
+    min_delta_ms: int = 0,
+    allow_skew_ms: int = 1000,
+) -> None:
+    """
+    Validate modified_at moved forward after a mutating operation, allowing small clock jitter.
+    """
+    __tracebackhide__ = True
+    delta_ms = _to_ms(after) - _to_ms(before)
+    assert delta_ms >= min_delta_ms - allow_skew_ms, (
+        f"modified_at did not update as expected: delta_ms={delta_ms} "
+        f"(min_delta_ms={min_delta_ms}, allow_skew_ms={allow_skew_ms})"
+    )
+
+
+def assert_endpoint_has_port(endpoint: str, expected_port: int) -> None:
+    __tracebackhide__ = True
+    assert endpoint
+    assert "://" not in endpoint, f"unexpected scheme in endpoint: {endpoint}"
+    port = str(expected_port)
+    # Single rfind per form instead of endswith/split/rsplit scans.
+    sep = endpoint.rfind("/")
+    if sep >= 0:
+        assert endpoint[sep + 1:] == port, (
+            f"endpoint route must end with /{expected_port}: {endpoint}"
+        )
+        assert endpoint[0] != "/", f"missing domain in endpoint: {endpoint}"
+        return
+    colon = endpoint.rfind(":")
+    assert colon > 0, f"endpoint must be host:port: {endpoint}"
+    assert endpoint[colon + 1:] == port
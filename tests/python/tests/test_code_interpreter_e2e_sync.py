@@ -43,6 +43,7 @@ from opensandbox.models.execd import (
 from opensandbox.models.execd_sync import ExecutionHandlersSync
 from opensandbox.models.sandboxes import Host, SandboxImageSpec, Volume
 
+from tests.assert_helpers import assert_endpoint_has_port
 from tests.base_e2e_test import (
     create_connection_config_sync,
     get_e2e_sandbox_resource,
@@ -63,21 +64,6 @@ def _assert_recent_timestamp_ms(ts: int, *, tolerance_ms: int = 180_000) -> None
     assert delta <= tolerance_ms, f"timestamp too far from now: delta={delta}ms (ts={ts})"
 
 
-def _assert_endpoint_has_port(endpoint: str, expected_port: int) -> None:
-    assert endpoint
-    assert "://" not in endpoint, f"unexpected scheme in endpoint: {endpoint}"
-    if "/" in endpoint:
-        assert endpoint.endswith(f"/{expected_port}"), (
-            f"endpoint route must end with /{expected_port}: {endpoint}"
-        )
-        assert endpoint.split("/", 1)[0], f"missing domain in endpoint: {endpoint}"
-        return
-    host, port = endpoint.rsplit(":", 1)
-    assert host
-    assert port.isdigit()
-    assert int(port) == expected_port
-
-
 def _assert_terminal_event_contract(
     *,
     init_events: list[ExecutionInit],
@@ -402,7 +388,7 @@ class TestCodeInterpreterE2ESync:
         endpoint = code_interpreter.sandbox.get_endpoint(DEFAULT_EXECD_PORT)
         assert endpoint is not None
         assert endpoint.endpoint is not None
-        _assert_endpoint_has_port(endpoint.endpoint, DEFAULT_EXECD_PORT)
+        assert_endpoint_has_port(endpoint.endpoint, DEFAULT_EXECD_PORT)
 
         metrics = code_interpreter.sandbox.get_metrics()
         assert metrics is not None
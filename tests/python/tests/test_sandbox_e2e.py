@@ -1333,8 +1333,9 @@ class TestSandboxE2E:
         assert dir_info_map[test_dir1].group
         _assert_times_close(dir_info_map[test_dir1].created_at, dir_info_map[test_dir1].modified_at)
 
+        # List just the two directories: one process, no grep, no matches from unrelated entries.
         ls_result = await sandbox.commands.run(
-            "ls -la | grep fs_test",
+            f"ls -ld {test_dir1} {test_dir2}",
             opts=RunCommandOpts(working_directory="/tmp"),
         )
         assert len(ls_result.logs.stdout) == 2, "Should find exactly 2 directories"
@@ -1564,7 +1565,7 @@ class TestSandboxE2E:
         logger.info("Step 11: Delete directories recursively (delete_directories)")
         await sandbox.files.delete_directories([test_dir1, test_dir2])
         verify_dirs_deleted = await sandbox.commands.run(
-            f"test ! -d {test_dir1} && test ! -d {test_dir2} && echo OK",
+            f"test ! -e {test_dir1} -a ! -e {test_dir2} && echo OK",
             opts=RunCommandOpts(working_directory="/tmp"),
         )
         for _ in range(3):
@@ -1577,7 +1578,7 @@ class TestSandboxE2E:
                 break
             await asyncio.sleep(1)
             verify_dirs_deleted = await sandbox.commands.run(
-                f"test ! -d {test_dir1} && test ! -d {test_dir2} && echo OK",
+                f"test ! -e {test_dir1} -a ! -e {test_dir2} && echo OK",
                 opts=RunCommandOpts(working_directory="/tmp"),
             )
         assert verify_dirs_deleted.error is None
@@ -19,12 +19,17 @@ Comprehensive Sync E2E tests for SandboxSync functionality.
 This mirrors `test_sandbox_e2e.py` but uses the synchronous SDK.
 """
 
+import asyncio
 import logging
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from datetime import timedelta
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from io import BytesIO
 from threading import Event
+from typing import TypeVar
 
 import httpx
 import pytest
@@ -42,6 +47,7 @@ from opensandbox.models.execd_sync import ExecutionHandlersSync
 from opensandbox.models.filesystem import (
     ContentReplaceEntry,
     MoveEntry,
+    ReadEntry,
     SearchEntry,
     SetPermissionEntry,
     WriteEntry,
@@ -55,6 +61,12 @@ from opensandbox.models.sandboxes import (
     Volume,
 )
 
+from tests.assert_helpers import (
+    assert_modified_updated,
+    assert_recent_timestamp_ms,
+    assert_times_close,
+    now_ms,
+)
 from tests.base_e2e_test import (
     TEST_API_KEY,
     TEST_DOMAIN,
@@ -69,36 +81,283 @@ from tests.base_e2e_test import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Section banners for the test logs, built once instead of per log call.
+_BANNER = "=" * 80
+_BANNER_BIG = "=" * 100
+
+
+@dataclass
+class _CapturedEvents:
+    """Events delivered to the handlers built by ``_make_capture``."""
+
+    stdout: list[OutputMessage] = field(default_factory=list)
+    stderr: list[OutputMessage] = field(default_factory=list)
+    results: list = field(default_factory=list)
+    completed: list[ExecutionComplete] = field(default_factory=list)
+    errors: list[ExecutionError] = field(default_factory=list)
+    init: list[ExecutionInit] = field(default_factory=list)
+
+    def clear(self) -> None:
+        for captured in (self.stdout, self.stderr, self.results, self.completed, self.errors, self.init):
+            captured.clear()
+
+
+def _make_capture() -> tuple[_CapturedEvents, ExecutionHandlersSync]:
+    # Bound list.append handlers record each event without an extra Python frame.
+    events = _CapturedEvents()
+    handlers = ExecutionHandlersSync(
+        on_stdout=events.stdout.append,
+        on_stderr=events.stderr.append,
+        on_result=events.results.append,
+        on_execution_complete=events.completed.append,
+        on_error=events.errors.append,
+        on_init=events.init.append,
+    )
+    return events, handlers
+
+
+def _adaptive_poll(
+    fn: Callable[[], T],
+    predicate: Callable[[T], bool],
+    *,
+    initial_ms: float = 50,
+    max_ms: float = 1000,
+    budget_ms: float = 20_000,
+) -> T:
+    """
+    Call ``fn`` until ``predicate`` accepts its result or ``budget_ms`` elapses.
+
+    The sleep between attempts starts at ``initial_ms`` and grows 1.5x up to ``max_ms``,
+    so the common fast case is observed within ~100ms while slow cases keep the old budget.
+    Returns the last result either way; callers assert on it.
+    """
+    deadline = time.monotonic() + budget_ms / 1000
+    delay_ms = initial_ms
+    while True:
+        result = fn()
+        if predicate(result) or time.monotonic() >= deadline:
+            return result
+        time.sleep(delay_ms / 1000)
+        delay_ms = min(max_ms, delay_ms * 1.5)
+
+
+def _multimount_volumes() -> list[Volume]:
+    """Every volume exercised by test_01b..01f, each at its own mount path; host mounts are Docker-only."""
+    host_dir = get_test_host_volume_dir()
+    pvc_volume_name = get_test_pvc_name()
+    volumes: list[Volume] = []
+    if not is_kubernetes_runtime():
+        volumes += [
+            Volume(
+                name="test-host-vol",
+                host=Host(path=host_dir),
+                mountPath="/mnt/host-data",
+                readOnly=False,
+            ),
+            Volume(
+                name="test-host-vol-ro",
+                host=Host(path=host_dir),
+                mountPath="/mnt/host-data-ro",
+                readOnly=True,
+            ),
+        ]
+    volumes += [
+        Volume(
+            name="test-pvc-vol",
+            pvc=PVC(claimName=pvc_volume_name),
+            mountPath="/mnt/pvc-data",
+            readOnly=False,
+        ),
+        Volume(
+            name="test-pvc-vol-ro",
+            pvc=PVC(claimName=pvc_volume_name),
+            mountPath="/mnt/pvc-data-ro",
+            readOnly=True,
+        ),
+        Volume(
+            name="test-pvc-subpath",
+            pvc=PVC(claimName=pvc_volume_name),
+            mountPath="/mnt/train",
+            readOnly=False,
+            subPath="datasets/train",
+        ),
+    ]
+    return volumes
+
+
+_shared_config: ConnectionConfigSync | None = None
+_shared_config_lock = threading.Lock()
+
+
+def _get_shared_config() -> ConnectionConfigSync:
+    """
+    Connection config shared by every ad-hoc sandbox in this module.
+
+    Created on first use and reused across tests and threads, so the httpx transport
+    and its keep-alive pool are not rebuilt per sandbox; ``httpx.HTTPTransport`` is
+    thread-safe. The transport is user-owned, so ``sandbox.close()`` leaves it open;
+    ``_close_shared_config`` closes it.
+    """
+    global _shared_config
+    with _shared_config_lock:
+        if _shared_config is None:
+            _shared_config = create_connection_config_sync()
+        return _shared_config
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_shared_config():
+    global _shared_config
+    yield
+    # Pending teardowns still use the transport, so let them finish first.
+    _teardown_pool.shutdown(wait=True)
+    with _shared_config_lock:
+        cfg, _shared_config = _shared_config, None
+    if cfg is not None:
+        try:
+            cfg.transport.close()
+        except Exception:
+            pass
+
+
+def _close_sandbox(sandbox: SandboxSync) -> None:
+    try:
+        sandbox.kill()
+    except Exception:
+        pass
+    sandbox.close()
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
 
+# kill() blocks until the runtime has torn the sandbox down; doing that off the test
+# thread lets the next test start while the previous sandbox is still going away.
+_teardown_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="e2e-teardown")
 
-def _assert_recent_timestamp_ms(ts: int, *, tolerance_ms: int = 60_000) -> None:
-    assert isinstance(ts, int)
-    assert ts > 0
-    delta = abs(_now_ms() - ts)
-    assert delta <= tolerance_ms, f"timestamp too far from now: delta={delta}ms (ts={ts})"
 
+def _close_sandbox_in_background(sandbox: SandboxSync) -> None:
+    """
+    Hand ``_close_sandbox`` to ``_teardown_pool`` without waiting for it.
+
+    Only for sandboxes on the ``_get_shared_config()`` config: its transport stays open
+    until ``_close_shared_config`` has drained the pool.
+    """
+
+    def _teardown() -> None:
+        try:
+            _close_sandbox(sandbox)
+        except Exception as e:
+            logger.warning("Teardown: closing sandbox %s failed: %s", sandbox.id, e, exc_info=True)
+
+    _teardown_pool.submit(_teardown)
 
-def _assert_times_close(created_at, modified_at, *, tolerance_seconds: float = 2.0) -> None:
+
+def _run_in_thread(fn: Callable[[], T]) -> Future[T]:
     """
-    Some filesystems / implementations may report created/modified with slight reordering.
-    We only assert they're close, and rely on explicit update operations to validate mtime.
+    Run ``fn`` on its own daemon thread and return a Future for its outcome.
+
+    For a single call that needs a timeout; cheaper than a one-worker pool. The thread is
+    a daemon so a call stuck on a frozen sandbox cannot hold up interpreter exit.
     """
-    delta = abs((modified_at - created_at).total_seconds())
-    assert delta <= tolerance_seconds, f"created/modified skew too large: {delta}s"
+    future: Future[T] = Future()
+
+    def _target() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_target, daemon=True).start()
+    return future
 
 
-def _assert_modified_updated(before, after, *, min_delta_ms: int = 0, allow_skew_ms: int = 1000) -> None:
+def _wait_for_egress_policy(
+    sandbox: SandboxSync, *, allowed: str, denied: str, budget_ms: float = 10_000
+) -> None:
     """
-    Validate modified_at moved forward after a mutating operation, allowing small clock jitter.
+    Wait until the sandbox egress policy is in force instead of sleeping a fixed time.
+
+    Probes the actual precondition of the network-policy assertions: ``allowed`` is
+    reachable and ``denied`` is not. Returns after ``budget_ms`` regardless, so the
+    caller's own assertions report a policy that never converged.
     """
-    delta_ms = int((after - before).total_seconds() * 1000)
-    assert delta_ms >= min_delta_ms - allow_skew_ms, (
-        f"modified_at did not update as expected: delta_ms={delta_ms} "
-        f"(min_delta_ms={min_delta_ms}, allow_skew_ms={allow_skew_ms})"
+    probe = (
+        f"curl -Is --max-time 2 {allowed} > /dev/null"
+        f" && ! curl -Is --max-time 2 {denied} > /dev/null"
     )
+    _adaptive_poll(
+        lambda: sandbox.commands.run(probe),
+        lambda r: r.error is None,
+        budget_ms=budget_ms,
+    )
+
+
+def _boot_sandbox(**kwargs) -> SandboxSync:
+    """Create a shared fixture sandbox on the calling (worker) thread using the module's shared config."""
+    sandbox = SandboxSync.create(
+        image=SandboxImageSpec(get_sandbox_image()),
+        resource=get_e2e_sandbox_resource(),
+        connection_config=_get_shared_config(),
+        timeout=timedelta(minutes=5),
+        ready_timeout=timedelta(seconds=30),
+        **kwargs,
+    )
+    logger.info("✓ Fixture sandbox created: %s", sandbox.id)
+    return sandbox
+
+
+@pytest.fixture(scope="module")
+async def _prebooted_sandboxes():
+    """
+    Boot every shared fixture sandbox of this module concurrently.
+
+    Each ``SandboxSync.create`` blocks on sandbox boot, so they run on worker threads via
+    ``asyncio.to_thread`` and the module pays for the slowest boot instead of the sum.
+    Only this setup choreography is async; the tests and the SDK calls stay sync.
+    Failed boots are stored as exceptions and re-raised by the fixture that needs them.
+    """
+    specs: dict[str, dict] = {"multimount": {"volumes": _multimount_volumes()}}
+    if not is_kubernetes_runtime():
+        specs["netpol"] = {
+            "network_policy": NetworkPolicy(
+                defaultAction="deny",
+                egress=[NetworkRule(action="allow", target="pypi.org")],
+            ),
+        }
+    booted = await asyncio.gather(
+        *(asyncio.to_thread(_boot_sandbox, **kwargs) for kwargs in specs.values()),
+        return_exceptions=True,
+    )
+    sandboxes = dict(zip(specs, booted, strict=True))
+    try:
+        yield sandboxes
+    finally:
+        for sandbox in sandboxes.values():
+            if isinstance(sandbox, SandboxSync):
+                _close_sandbox_in_background(sandbox)
+
+
+def _prebooted(sandboxes: dict[str, SandboxSync | BaseException], key: str) -> SandboxSync:
+    sandbox = sandboxes[key]
+    if isinstance(sandbox, BaseException):
+        raise sandbox
+    return sandbox
+
+
+@pytest.fixture(scope="module")
+def _netpol_sandbox(_prebooted_sandboxes):
+    """
+    Sandbox created with a deny-by-default egress policy allowing only pypi.org.
+
+    The policy is fixed at creation time, so the read-only test_01a checks share one boot.
+    test_01aa patches the policy and keeps its own sandbox.
+    """
+    if is_kubernetes_runtime():
+        pytest.skip("Network policy is not covered in the Kubernetes runtime suite")
+
+    sandbox = _prebooted(_prebooted_sandboxes, "netpol")
+    _wait_for_egress_policy(sandbox, allowed="https://pypi.org", denied="https://www.github.com")
+    return sandbox
 
 
 class TestSandboxE2ESync:
@@ -107,14 +366,26 @@ class TestSandboxE2ESync:
     sandbox = None
     connection_config = None
     _setup_done = False
+    multimount_sandbox = None
+    # Shared by the tests that run a call off the test thread; created with the sandbox.
+    _pool: ThreadPoolExecutor | None = None
 
     @pytest.fixture(scope="class", autouse=True)
     def _sandbox_lifecycle(self, request):
-        """Create sandbox once and ALWAYS cleanup to avoid resource leaks."""
+        """Create sandbox once and ALWAYS cleanup to avoid resource leaks.
+
+        Autouse, so every test in the class (even when selected on its own) can read
+        ``TestSandboxE2ESync.sandbox`` without calling ``_ensure_sandbox_created`` itself.
+        """
         request.cls._ensure_sandbox_created()
         try:
             yield
         finally:
+            pool = request.cls._pool
+            if pool is not None:
+                request.cls._pool = None
+                pool.shutdown(wait=True)
+
             sandbox = request.cls.sandbox
             if sandbox is not None:
                 try:
@@ -135,21 +406,22 @@ class TestSandboxE2ESync:
 
     @classmethod
     def _ensure_sandbox_created(cls) -> None:
+        if cls._pool is None:
+            cls._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="e2e-sync-worker")
         if cls._setup_done:
             return
 
-        logger.info("=" * 100)
+        logger.info(_BANNER_BIG)
         logger.info("SETUP: Creating sandbox (sync)")
-        logger.info("=" * 100)
+        logger.info(_BANNER_BIG)
 
         cls.connection_config = create_connection_config_sync()
 
-        cls.sandbox = SandboxSync.create(
+        sandbox = SandboxSync.create(
             image=SandboxImageSpec(get_sandbox_image()),
             resource=get_e2e_sandbox_resource(),
             connection_config=cls.connection_config,
             timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
             metadata={"tag": "e2e-test"},
             env={
                 "E2E_TEST": "true",
@@ -160,23 +432,43 @@ class TestSandboxE2ESync:
                 "EXECD_API_GRACE_SHUTDOWN": "3s",
                 "EXECD_JUPYTER_IDLE_POLL_INTERVAL": "200ms",
             },
-            health_check_polling_interval=timedelta(milliseconds=500),
+            skip_health_check=True,
         )
+        # The SDK only offers fixed-interval readiness polling (no push event), so wait on a
+        # geometric schedule: an immediate probe, then 100ms growing to 1s, bounded at 30s.
+        if not _adaptive_poll(
+            sandbox.is_healthy, bool, initial_ms=100, max_ms=1000, budget_ms=30_000
+        ):
+            _close_sandbox(sandbox)
+            raise AssertionError(f"Sandbox {sandbox.id} did not become healthy within 30s")
+        cls.sandbox = sandbox
 
         logger.info("✓ Sandbox created: %s", cls.sandbox.id)
         cls._setup_done = True
 
+    @pytest.fixture(scope="class")
+    def _multimount_sandbox(self, request, _prebooted_sandboxes):
+        """Publish the sandbox with every test_01b..01f volume mounted, shared by those tests.
+
+        The mount spec is the only thing that differs between them, so a single boot
+        replaces five; each test asserts only on its own mount path.
+        """
+        sandbox = _prebooted(_prebooted_sandboxes, "multimount")
+        request.cls.multimount_sandbox = sandbox
+        try:
+            yield sandbox
+        finally:
+            request.cls.multimount_sandbox = None
+
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
     def test_01_sandbox_lifecycle_and_health(self) -> None:
         """Test sandbox lifecycle and health monitoring."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1: Testing sandbox lifecycle and health monitoring (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         assert isinstance(sandbox.id, str)
         assert sandbox.is_healthy() is True
@@ -214,7 +506,7 @@ class TestSandboxE2ESync:
         assert 0.0 <= metrics.cpu_used_percentage <= 100.0
         assert metrics.memory_total_in_mib > 0
         assert 0.0 <= metrics.memory_used_in_mib <= metrics.memory_total_in_mib
-        _assert_recent_timestamp_ms(metrics.timestamp, tolerance_ms=120_000)
+        assert_recent_timestamp_ms(metrics.timestamp, tolerance_ms=120_000)
 
         await_renew = timedelta(minutes=20)
         renew_response = sandbox.renew(await_renew)
@@ -225,7 +517,7 @@ class TestSandboxE2ESync:
         assert renewed_info.expires_at > info.expires_at
         assert abs((renewed_info.expires_at - renew_response.expires_at).total_seconds()) < 10
 
-        now = renewed_info.expires_at.__class__.now(tz=renewed_info.expires_at.tzinfo)
+        now = datetime.now(tz=renewed_info.expires_at.tzinfo)
         remaining = renewed_info.expires_at - now
         assert remaining > timedelta(minutes=18), f"Remaining TTL too small: {remaining}"
         assert remaining < timedelta(minutes=22), f"Remaining TTL too large: {remaining}"
@@ -252,12 +544,11 @@ class TestSandboxE2ESync:
             sandbox2.close()
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
     def test_01b_manual_cleanup(self) -> None:
         sandbox = SandboxSync.create(
             image=SandboxImageSpec(get_sandbox_image()),
             resource=get_e2e_sandbox_resource(),
-            connection_config=TestSandboxE2ESync.connection_config,
+            connection_config=_get_shared_config(),
             timeout=None,
             ready_timeout=timedelta(seconds=30),
             metadata={"tag": "manual-e2e-test"},
@@ -268,63 +559,41 @@ class TestSandboxE2ESync:
             assert info.metadata is not None
             assert info.metadata.get("tag") == "manual-e2e-test"
         finally:
-            sandbox.kill()
-            sandbox.close()
+            _close_sandbox_in_background(sandbox)
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
-    def test_01a_network_policy_create(self) -> None:
-        if is_kubernetes_runtime():
-            pytest.skip("Network policy is not covered in the Kubernetes runtime suite")
+    def test_01a_netpol_deny_github(self, _netpol_sandbox) -> None:
+        """Egress outside the deny-by-default policy's allow list is blocked (sync)."""
+        logger.info(_BANNER)
+        logger.info("TEST 1a: networkPolicy denies non-allowed egress (sync)")
+        logger.info(_BANNER)
 
-        logger.info("=" * 80)
-        logger.info("TEST 1a: Creating sandbox with networkPolicy (sync)")
-        logger.info("=" * 80)
+        result = _netpol_sandbox.commands.run("curl -I https://www.github.com")
+        assert result.error is not None
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            network_policy=NetworkPolicy(
-                defaultAction="deny",
-                egress=[NetworkRule(action="allow", target="pypi.org")],
-            ),
-        )
-        try:
-            time.sleep(5)
-            result = sandbox.commands.run("curl -I https://www.github.com")
-            assert result.error is not None
-            result = sandbox.commands.run("curl -I https://pypi.org")
-            assert result.error is None
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+    @pytest.mark.timeout(120)
+    def test_01a_netpol_allow_pypi(self, _netpol_sandbox) -> None:
+        """Egress to a target on the policy's allow list succeeds (sync)."""
+        logger.info(_BANNER)
+        logger.info("TEST 1a: networkPolicy allows listed egress (sync)")
+        logger.info(_BANNER)
+
+        result = _netpol_sandbox.commands.run("curl -I https://pypi.org")
+        assert result.error is None
 
     @pytest.mark.timeout(180)
-    @pytest.mark.order(1)
     def test_01aa_network_policy_get_and_patch(self) -> None:
         if is_kubernetes_runtime():
             pytest.skip("Network policy is not covered in the Kubernetes runtime suite")
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1aa: networkPolicy get/patch (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        cfg = create_connection_config_sync()
         sandbox = SandboxSync.create(
             image=SandboxImageSpec(get_sandbox_image()),
             resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
+            connection_config=_get_shared_config(),
             timeout=timedelta(minutes=5),
             ready_timeout=timedelta(seconds=30),
             network_policy=NetworkPolicy(
@@ -332,17 +601,18 @@ class TestSandboxE2ESync:
                 egress=[NetworkRule(action="allow", target="pypi.org")],
             ),
         )
+        cmds = sandbox.commands
         try:
-            time.sleep(5)
+            _wait_for_egress_policy(sandbox, allowed="https://pypi.org", denied="https://www.github.com")
 
             policy = sandbox.get_egress_policy()
             assert policy.default_action == "deny"
             assert policy.egress is not None
             assert any(rule.target == "pypi.org" and rule.action == "allow" for rule in policy.egress)
 
-            blocked = sandbox.commands.run("curl -I https://www.github.com")
+            blocked = cmds.run("curl -I https://www.github.com")
             assert blocked.error is not None
-            allowed = sandbox.commands.run("curl -I https://pypi.org")
+            allowed = cmds.run("curl -I https://pypi.org")
             assert allowed.error is None
 
             sandbox.patch_egress_rules(
@@ -351,7 +621,7 @@ class TestSandboxE2ESync:
                     NetworkRule(action="deny", target="pypi.org"),
                 ],
             )
-            time.sleep(2)
+            _wait_for_egress_policy(sandbox, allowed="https://www.github.com", denied="https://pypi.org")
 
             patched_policy = sandbox.get_egress_policy()
             assert patched_policy.egress is not None
@@ -364,440 +634,233 @@ class TestSandboxE2ESync:
                 for rule in patched_policy.egress
             )
 
-            github_allowed = sandbox.commands.run("curl -I https://www.github.com")
+            github_allowed = cmds.run("curl -I https://www.github.com")
             assert github_allowed.error is None
-            pypi_denied = sandbox.commands.run("curl -I https://pypi.org")
+            pypi_denied = cmds.run("curl -I https://pypi.org")
             assert pypi_denied.error is not None
         finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+            _close_sandbox_in_background(sandbox)
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
+    @pytest.mark.usefixtures("_multimount_sandbox")
     def test_01b_host_volume_mount(self) -> None:
         """Test creating a sandbox with a host volume mount (sync)."""
         if is_kubernetes_runtime():
             pytest.skip("Host path volume E2E is only covered in the Docker runtime suite")
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1b: Creating sandbox with host volume mount (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        host_dir = get_test_host_volume_dir()
         container_mount_path = "/mnt/host-data"
+        marker_path = f"{container_mount_path}/marker.txt"
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            volumes=[
-                Volume(
-                    name="test-host-vol",
-                    host=Host(path=host_dir),
-                    mountPath=container_mount_path,
-                    readOnly=False,
-                ),
-            ],
-        )
-        try:
-            logger.info("✓ Sandbox with volume created: %s", sandbox.id)
-
-            # Step 1: Verify the host marker file is visible inside the sandbox
-            # Retry: bind mount propagation can sometimes lag on first access
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/marker.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None, f"Failed to read marker file: {result.error}"
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "opensandbox-e2e-marker"
-            logger.info("✓ Host marker file read successfully inside sandbox")
-
-            # Step 2: Write a file from inside the sandbox to the mounted path (read-write)
-            result = sandbox.commands.run(
-                f"echo 'written-from-sandbox' > {container_mount_path}/sandbox-output.txt"
-            )
-            assert result.error is None, f"Failed to write file: {result.error}"
-
-            # Step 3: Verify the written file is readable
-            # Retry: written data may not be immediately visible through bind mount
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/sandbox-output.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "written-from-sandbox"
-            logger.info("✓ File written and verified inside sandbox")
-
-            # Step 4: Verify the mount path is a proper directory
-            result = sandbox.commands.run(f"test -d {container_mount_path} && echo OK")
-            assert result.error is None
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "OK"
-            logger.info("✓ Mount path is a valid directory")
+        sandbox = TestSandboxE2ESync.multimount_sandbox
+        assert sandbox is not None
 
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+        # Steps 1-4 in one round-trip: read the host marker, write through the RW mount,
+        # read it back and check the mount path is a directory. The whole chain is retried
+        # because bind mount propagation can lag on first access; the write is idempotent.
+        output_path = f"{container_mount_path}/sandbox-output.txt"
+        mount_checks = (
+            f"cat {marker_path}"
+            f" && echo 'written-from-sandbox' > {output_path}"
+            f" && cat {output_path}"
+            f" && test -d {container_mount_path} && echo OK"
+        )
+        result = _adaptive_poll(
+            lambda: sandbox.commands.run(mount_checks),
+            lambda r: r.error is None and len(r.logs.stdout) == 3,
+            budget_ms=2_500,
+        )
+        assert result.error is None, f"Mount checks failed: {result.error}"
+        assert [m.text for m in result.logs.stdout] == [
+            "opensandbox-e2e-marker",
+            "written-from-sandbox",
+            "OK",
+        ]
+        logger.info("✓ Host marker read, sandbox write verified, mount path is a directory")
 
         logger.info("TEST 1b PASSED: Host volume mount test completed successfully")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
+    @pytest.mark.usefixtures("_multimount_sandbox")
     def test_01c_host_volume_mount_readonly(self) -> None:
         """Test creating a sandbox with a read-only host volume mount (sync)."""
         if is_kubernetes_runtime():
             pytest.skip("Host path volume E2E is only covered in the Docker runtime suite")
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1c: Creating sandbox with read-only host volume mount (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        host_dir = get_test_host_volume_dir()
         container_mount_path = "/mnt/host-data-ro"
+        cat_marker = f"cat {container_mount_path}/marker.txt"
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            volumes=[
-                Volume(
-                    name="test-host-vol-ro",
-                    host=Host(path=host_dir),
-                    mountPath=container_mount_path,
-                    readOnly=True,
-                ),
-            ],
-        )
-        try:
-            logger.info("✓ Sandbox with read-only volume created: %s", sandbox.id)
-
-            # Step 1: Verify the host marker file is readable
-            # Retry: bind mount propagation can sometimes lag on first access
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/marker.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None, f"Failed to read marker file: {result.error}"
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "opensandbox-e2e-marker"
-            logger.info("✓ Host marker file read successfully in read-only mount")
-
-            # Step 2: Verify writing is denied on read-only mount
-            result = sandbox.commands.run(
-                f"touch {container_mount_path}/should-fail.txt"
-            )
-            assert result.error is not None, "Write should fail on read-only mount"
-            logger.info("✓ Write correctly denied on read-only mount")
+        sandbox = TestSandboxE2ESync.multimount_sandbox
+        assert sandbox is not None
 
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+        # Step 1: Verify the host marker file is readable
+        # Retry: bind mount propagation can sometimes lag on first access
+        result = _adaptive_poll(
+            lambda: sandbox.commands.run(cat_marker),
+            lambda r: bool(r.logs.stdout),
+            budget_ms=2_500,
+        )
+        assert result.error is None, f"Failed to read marker file: {result.error}"
+        assert len(result.logs.stdout) == 1
+        assert result.logs.stdout[0].text == "opensandbox-e2e-marker"
+        logger.info("✓ Host marker file read successfully in read-only mount")
+
+        # Step 2: Verify writing is denied on read-only mount
+        result = sandbox.commands.run(
+            f"touch {container_mount_path}/should-fail.txt"
+        )
+        assert result.error is not None, "Write should fail on read-only mount"
+        logger.info("✓ Write correctly denied on read-only mount")
 
         logger.info("TEST 1c PASSED: Read-only host volume mount test completed successfully")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
+    @pytest.mark.usefixtures("_multimount_sandbox")
     def test_01d_pvc_named_volume_mount(self) -> None:
         """Test creating a sandbox with a PVC (Docker named volume) mount (sync)."""
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1d: Creating sandbox with PVC named volume mount (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        pvc_volume_name = get_test_pvc_name()
         container_mount_path = "/mnt/pvc-data"
+        marker_path = f"{container_mount_path}/marker.txt"
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            volumes=[
-                Volume(
-                    name="test-pvc-vol",
-                    pvc=PVC(claimName=pvc_volume_name),
-                    mountPath=container_mount_path,
-                    readOnly=False,
-                ),
-            ],
-        )
-        try:
-            logger.info("✓ Sandbox with PVC volume created: %s", sandbox.id)
-
-            # Step 1: Verify the marker file seeded into the named volume is readable
-            # Retry: bind mount propagation can sometimes lag on first access
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/marker.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None, f"Failed to read marker file: {result.error}"
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "pvc-marker-data"
-            logger.info("✓ PVC marker file read successfully inside sandbox")
-
-            # Step 2: Write a file from inside the sandbox to the named volume
-            result = sandbox.commands.run(
-                f"echo 'written-to-pvc' > {container_mount_path}/pvc-output.txt"
-            )
-            assert result.error is None, f"Failed to write file: {result.error}"
-
-            # Step 3: Verify the written file is readable
-            # Retry: written data may not be immediately visible through bind mount
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/pvc-output.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "written-to-pvc"
-            logger.info("✓ File written and verified inside sandbox via PVC mount")
-
-            # Step 4: Verify the mount path is a proper directory
-            result = sandbox.commands.run(f"test -d {container_mount_path} && echo OK")
-            assert result.error is None
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "OK"
-            logger.info("✓ PVC mount path is a valid directory")
+        sandbox = TestSandboxE2ESync.multimount_sandbox
+        assert sandbox is not None
 
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+        # Steps 1-4 in one round-trip: read the seeded marker, write into the named volume,
+        # read it back and check the mount path is a directory. The whole chain is retried
+        # because bind mount propagation can lag on first access; the write is idempotent.
+        output_path = f"{container_mount_path}/pvc-output.txt"
+        mount_checks = (
+            f"cat {marker_path}"
+            f" && echo 'written-to-pvc' > {output_path}"
+            f" && cat {output_path}"
+            f" && test -d {container_mount_path} && echo OK"
+        )
+        result = _adaptive_poll(
+            lambda: sandbox.commands.run(mount_checks),
+            lambda r: r.error is None and len(r.logs.stdout) == 3,
+            budget_ms=2_500,
+        )
+        assert result.error is None, f"Mount checks failed: {result.error}"
+        assert [m.text for m in result.logs.stdout] == [
+            "pvc-marker-data",
+            "written-to-pvc",
+            "OK",
+        ]
+        logger.info("✓ PVC marker read, sandbox write verified, mount path is a directory")
 
         logger.info("TEST 1d PASSED: PVC named volume mount test completed successfully")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
+    @pytest.mark.usefixtures("_multimount_sandbox")
     def test_01e_pvc_named_volume_mount_readonly(self) -> None:
         """Test creating a sandbox with a read-only PVC (Docker named volume) mount (sync)."""
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1e: Creating sandbox with read-only PVC named volume mount (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        pvc_volume_name = get_test_pvc_name()
         container_mount_path = "/mnt/pvc-data-ro"
+        cat_marker = f"cat {container_mount_path}/marker.txt"
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            volumes=[
-                Volume(
-                    name="test-pvc-vol-ro",
-                    pvc=PVC(claimName=pvc_volume_name),
-                    mountPath=container_mount_path,
-                    readOnly=True,
-                ),
-            ],
-        )
-        try:
-            logger.info("✓ Sandbox with read-only PVC volume created: %s", sandbox.id)
-
-            # Step 1: Verify the marker file is readable
-            # Retry: bind mount propagation can sometimes lag on first access
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/marker.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None, f"Failed to read marker file: {result.error}"
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "pvc-marker-data"
-            logger.info("✓ PVC marker file read successfully in read-only mount")
-
-            # Step 2: Verify writing is denied on read-only mount
-            result = sandbox.commands.run(
-                f"touch {container_mount_path}/should-fail.txt"
-            )
-            assert result.error is not None, "Write should fail on read-only PVC mount"
-            logger.info("✓ Write correctly denied on read-only PVC mount")
+        sandbox = TestSandboxE2ESync.multimount_sandbox
+        assert sandbox is not None
 
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+        # Step 1: Verify the marker file is readable
+        # Retry: bind mount propagation can sometimes lag on first access
+        result = _adaptive_poll(
+            lambda: sandbox.commands.run(cat_marker),
+            lambda r: bool(r.logs.stdout),
+            budget_ms=2_500,
+        )
+        assert result.error is None, f"Failed to read marker file: {result.error}"
+        assert len(result.logs.stdout) == 1
+        assert result.logs.stdout[0].text == "pvc-marker-data"
+        logger.info("✓ PVC marker file read successfully in read-only mount")
+
+        # Step 2: Verify writing is denied on read-only mount
+        result = sandbox.commands.run(
+            f"touch {container_mount_path}/should-fail.txt"
+        )
+        assert result.error is not None, "Write should fail on read-only PVC mount"
+        logger.info("✓ Write correctly denied on read-only PVC mount")
 
         logger.info("TEST 1e PASSED: Read-only PVC named volume mount test completed successfully")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(1)
+    @pytest.mark.usefixtures("_multimount_sandbox")
     def test_01f_pvc_named_volume_subpath_mount(self) -> None:
         """Test creating a sandbox with a PVC named volume mount using subPath (sync)."""
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 1f: Creating sandbox with PVC named volume subPath mount (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        pvc_volume_name = get_test_pvc_name()
         container_mount_path = "/mnt/train"
+        cat_marker = f"cat {container_mount_path}/marker.txt"
 
-        cfg = create_connection_config_sync()
-        sandbox = SandboxSync.create(
-            image=SandboxImageSpec(get_sandbox_image()),
-            resource=get_e2e_sandbox_resource(),
-            connection_config=cfg,
-            timeout=timedelta(minutes=5),
-            ready_timeout=timedelta(seconds=30),
-            volumes=[
-                Volume(
-                    name="test-pvc-subpath",
-                    pvc=PVC(claimName=pvc_volume_name),
-                    mountPath=container_mount_path,
-                    readOnly=False,
-                    subPath="datasets/train",
-                ),
-            ],
+        sandbox = TestSandboxE2ESync.multimount_sandbox
+        assert sandbox is not None
+        cmds = sandbox.commands
+
+        # Step 1: Verify the subpath marker file is readable
+        # Retry: bind mount propagation can sometimes lag on first access
+        result = _adaptive_poll(
+            lambda: cmds.run(cat_marker),
+            lambda r: bool(r.logs.stdout),
+            budget_ms=2_500,
         )
-        try:
-            logger.info("✓ Sandbox with PVC subPath volume created: %s", sandbox.id)
-
-            # Step 1: Verify the subpath marker file is readable
-            # Retry: bind mount propagation can sometimes lag on first access
-            for _attempt in range(5):
-                result = sandbox.commands.run(f"cat {container_mount_path}/marker.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(0.5)
-            assert result.error is None, f"Failed to read subpath marker file: {result.error}"
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "pvc-subpath-marker"
-            logger.info("✓ SubPath marker file read successfully")
-
-            # Step 2: Verify we only see the subpath contents (not the full volume)
-            result = sandbox.commands.run(f"ls {container_mount_path}/")
-            assert result.error is None
-            stdout_text = "\n".join(msg.text for msg in result.logs.stdout)
-            assert "marker.txt" in stdout_text
-            assert "datasets" not in stdout_text
-            logger.info("✓ Only subPath contents are visible inside the sandbox")
-
-            # Step 3: Write a file and verify (retry read-back for transient SSE drops)
-            result = sandbox.commands.run(
-                f"echo 'subpath-write-test' > {container_mount_path}/output.txt"
-            )
-            assert result.error is None
-            for _attempt in range(3):
-                result = sandbox.commands.run(f"cat {container_mount_path}/output.txt")
-                if result.logs.stdout:
-                    break
-                time.sleep(1)
-            assert result.error is None
-            assert len(result.logs.stdout) == 1
-            assert result.logs.stdout[0].text == "subpath-write-test"
-            logger.info("✓ File written and verified inside subPath mount")
-
-        finally:
-            try:
-                sandbox.kill()
-            except Exception:
-                pass
-            sandbox.close()
-            try:
-                cfg.transport.close()
-            except Exception:
-                pass
+        assert result.error is None, f"Failed to read subpath marker file: {result.error}"
+        assert len(result.logs.stdout) == 1
+        assert result.logs.stdout[0].text == "pvc-subpath-marker"
+        logger.info("✓ SubPath marker file read successfully")
+
+        # Step 2: Verify we only see the subpath contents (not the full volume)
+        result = cmds.run(f"ls {container_mount_path}/")
+        assert result.error is None
+        stdout_text = "\n".join(msg.text for msg in result.logs.stdout)
+        assert "marker.txt" in stdout_text
+        assert "datasets" not in stdout_text
+        logger.info("✓ Only subPath contents are visible inside the sandbox")
+
+        # Step 3: Write a file and read it back in the same shell, so the read cannot
+        # race the write across two separate command streams.
+        output_path = f"{container_mount_path}/output.txt"
+        result = cmds.run(
+            f"echo 'subpath-write-test' > {output_path} && sync && cat {output_path}"
+        )
+        assert result.error is None, f"Failed to write/read subpath file: {result.error}"
+        assert len(result.logs.stdout) == 1
+        assert result.logs.stdout[0].text == "subpath-write-test"
+        logger.info("✓ File written and verified inside subPath mount")
 
         logger.info("TEST 1f PASSED: PVC subPath named volume mount test completed successfully")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(2)
     def test_02_basic_command_execution(self) -> None:
         """Test basic command execution."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
+        cmds = sandbox.commands
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 2: Testing basic command execution (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        stdout_messages: list[OutputMessage] = []
-        stderr_messages: list[OutputMessage] = []
-        results = []
-        completed_events: list[ExecutionComplete] = []
-        errors: list[ExecutionError] = []
-        init_events: list[ExecutionInit] = []
-
-        def on_stdout(msg):
-            stdout_messages.append(msg)
-
-        def on_stderr(msg):
-            stderr_messages.append(msg)
-
-        def on_result(result):
-            results.append(result)
-
-        def on_execution_complete(complete):
-            completed_events.append(complete)
-
-        def on_error(error):
-            errors.append(error)
-
-        def on_init(init):
-            init_events.append(init)
+        events, handlers = _make_capture()
 
-        handlers = ExecutionHandlersSync(
-            on_stdout=on_stdout,
-            on_stderr=on_stderr,
-            on_result=on_result,
-            on_execution_complete=on_execution_complete,
-            on_error=on_error,
-            on_init=on_init,
-        )
-
-        echo_result = sandbox.commands.run(
+        echo_result = cmds.run(
             "echo 'Hello OpenSandbox E2E'",
             handlers=handlers,
         )
+        now = now_ms()
 
         assert echo_result is not None
         assert echo_result.id is not None and echo_result.id.strip()
@@ -805,26 +868,26 @@ class TestSandboxE2ESync:
         assert len(echo_result.logs.stdout) == 1
         assert echo_result.logs.stdout[0].text == "Hello OpenSandbox E2E"
         assert echo_result.logs.stdout[0].is_error is False
-        _assert_recent_timestamp_ms(echo_result.logs.stdout[0].timestamp)
+        assert_recent_timestamp_ms(echo_result.logs.stdout[0].timestamp, now_ms=now)
         assert len(echo_result.logs.stderr) == 0
         assert echo_result.exit_code == 0
         assert echo_result.complete is not None
         assert echo_result.complete.execution_time_in_millis >= 0
 
-        assert len(init_events) == 1
-        assert len(completed_events) == 1
-        assert init_events[0].id == echo_result.id
-        _assert_recent_timestamp_ms(init_events[0].timestamp)
-        _assert_recent_timestamp_ms(completed_events[0].timestamp)
-        assert completed_events[0].execution_time_in_millis >= 0
-
-        assert len(stdout_messages) == 1
-        assert stdout_messages[0].text == "Hello OpenSandbox E2E"
-        assert stdout_messages[0].is_error is False
-        _assert_recent_timestamp_ms(stdout_messages[0].timestamp)
-        assert len(errors) == 0
-
-        pwd_result = sandbox.commands.run(
+        assert len(events.init) == 1
+        assert len(events.completed) == 1
+        assert events.init[0].id == echo_result.id
+        assert_recent_timestamp_ms(events.init[0].timestamp, now_ms=now)
+        assert_recent_timestamp_ms(events.completed[0].timestamp, now_ms=now)
+        assert events.completed[0].execution_time_in_millis >= 0
+
+        assert len(events.stdout) == 1
+        assert events.stdout[0].text == "Hello OpenSandbox E2E"
+        assert events.stdout[0].is_error is False
+        assert_recent_timestamp_ms(events.stdout[0].timestamp, now_ms=now)
+        assert len(events.errors) == 0
+
+        pwd_result = cmds.run(
             "pwd",
             opts=RunCommandOpts(working_directory="/tmp"),
         )
@@ -834,12 +897,12 @@ class TestSandboxE2ESync:
         assert len(pwd_result.logs.stdout) == 1
         assert pwd_result.logs.stdout[0].text == "/tmp"
         assert pwd_result.logs.stdout[0].is_error is False
-        _assert_recent_timestamp_ms(pwd_result.logs.stdout[0].timestamp)
+        assert_recent_timestamp_ms(pwd_result.logs.stdout[0].timestamp)
         assert pwd_result.exit_code == 0
         assert pwd_result.complete is not None
 
         start_time = time.time()
-        background_result = sandbox.commands.run(
+        background_result = cmds.run(
             "sleep 30",
             opts=RunCommandOpts(background=True),
         )
@@ -848,58 +911,57 @@ class TestSandboxE2ESync:
         assert execution_time_ms < 10000
         assert background_result.exit_code is None
 
-        stdout_messages.clear()
-        stderr_messages.clear()
-        errors.clear()
-        completed_events.clear()
-        init_events.clear()
+        events.clear()
 
-        fail_result = sandbox.commands.run(
+        fail_result = cmds.run(
             "nonexistent-command-that-does-not-exist",
             handlers=handlers,
         )
+        now = now_ms()
 
         assert fail_result.error is not None
         assert fail_result.error.name == "CommandExecError"
         assert len(fail_result.logs.stderr) > 0
-        assert any(
-            "nonexistent-command-that-does-not-exist" in m.text for m in fail_result.logs.stderr
-        )
-        assert all(m.is_error is True for m in fail_result.logs.stderr)
-        _assert_recent_timestamp_ms(fail_result.logs.stderr[0].timestamp)
+        # One pass checks every stderr message and looks for the command name.
+        found = False
+        for m in fail_result.logs.stderr:
+            assert m.is_error is True
+            if "nonexistent-command-that-does-not-exist" in m.text:
+                found = True
+        assert found, "expected the missing command name in stderr"
+        assert_recent_timestamp_ms(fail_result.logs.stderr[0].timestamp, now_ms=now)
         assert fail_result.complete is None
         assert fail_result.exit_code == int(fail_result.error.value)
 
-        assert len(init_events) == 1
-        assert init_events[0].id == fail_result.id
-        _assert_recent_timestamp_ms(init_events[0].timestamp)
+        assert len(events.init) == 1
+        assert events.init[0].id == fail_result.id
+        assert_recent_timestamp_ms(events.init[0].timestamp, now_ms=now)
         # Contract: error and complete are mutually exclusive; failing command should emit error only.
-        assert len(errors) >= 1
-        assert len(completed_events) == 0
+        assert len(events.errors) >= 1
+        assert len(events.completed) == 0
 
-        assert errors[0].name == "CommandExecError"
-        assert len(stderr_messages) > 0
-        assert "nonexistent-command-that-does-not-exist" in stderr_messages[0].text
+        assert events.errors[0].name == "CommandExecError"
+        assert len(events.stderr) > 0
+        assert "nonexistent-command-that-does-not-exist" in events.stderr[0].text
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(2)
     def test_02c_bash_session_api(self) -> None:
         """Test create_session / run_in_session / delete_session (sync).
 
         Verifies working directory passing, session env persistence, and run_in_session exit_code behavior.
         """
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
+        cmds = sandbox.commands
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 2c: Bash session API (sync) — verify working directory is passed and applied")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         logger.info("Step 1: Create session with working_directory=/tmp and verify session starts in that directory")
-        sid = sandbox.commands.create_session(working_directory="/tmp")
+        sid = cmds.create_session(working_directory="/tmp")
         assert sid is not None and isinstance(sid, str) and len(sid) > 0
-        out_pwd = sandbox.commands.run_in_session(sid, "pwd")
+        out_pwd = cmds.run_in_session(sid, "pwd")
         assert out_pwd.error is None, f"pwd failed: {out_pwd.error}"
         assert out_pwd.exit_code == 0
         pwd_line = "".join(m.text for m in out_pwd.logs.stdout).strip()
@@ -907,7 +969,7 @@ class TestSandboxE2ESync:
         logger.info("✓ create_session(working_directory=/tmp) applied: pwd => %s", pwd_line)
 
         logger.info("Step 2: run_in_session with working_directory override — run in /var and verify")
-        out_var = sandbox.commands.run_in_session(sid, "pwd", working_directory="/var")
+        out_var = cmds.run_in_session(sid, "pwd", working_directory="/var")
         assert out_var.error is None
         assert out_var.exit_code == 0
         var_line = "".join(m.text for m in out_var.logs.stdout).strip()
@@ -915,7 +977,7 @@ class TestSandboxE2ESync:
         logger.info("✓ run_in_session(..., working_directory=/var) applied: pwd => %s", var_line)
 
         logger.info("Step 3: run_in_session with working_directory=/tmp — verify override per run")
-        out_tmp = sandbox.commands.run_in_session(sid, "pwd", working_directory="/tmp")
+        out_tmp = cmds.run_in_session(sid, "pwd", working_directory="/tmp")
         assert out_tmp.error is None
         assert out_tmp.exit_code == 0
         tmp_line = "".join(m.text for m in out_tmp.logs.stdout).strip()
@@ -923,8 +985,8 @@ class TestSandboxE2ESync:
         logger.info("✓ run_in_session(..., working_directory=/tmp) applied: pwd => %s", tmp_line)
 
         logger.info("Step 3b: Export env in one run, read in next run — verify session state (env) persists")
-        sandbox.commands.run_in_session(sid, "export E2E_SESSION_ENV=session-env-ok")
-        out_env = sandbox.commands.run_in_session(sid, "echo $E2E_SESSION_ENV")
+        cmds.run_in_session(sid, "export E2E_SESSION_ENV=session-env-ok")
+        out_env = cmds.run_in_session(sid, "echo $E2E_SESSION_ENV")
         assert out_env.error is None
         assert out_env.exit_code == 0
         env_line = "".join(m.text for m in out_env.logs.stdout).strip()
@@ -932,7 +994,7 @@ class TestSandboxE2ESync:
         logger.info("✓ session env persists across run_in_session: echo $E2E_SESSION_ENV => %s", env_line)
 
         logger.info("Step 3c: Failing subprocess in session should propagate non-zero exit_code")
-        fail = sandbox.commands.run_in_session(sid, "sh -c 'echo session-fail >&2; exit 7'")
+        fail = cmds.run_in_session(sid, "sh -c 'echo session-fail >&2; exit 7'")
         assert fail.error is not None
         assert fail.error.name == "CommandExecError"
         assert fail.error.value == "7"
@@ -941,9 +1003,9 @@ class TestSandboxE2ESync:
         logger.info("✓ run_in_session failure propagated exit_code=7")
 
         logger.info("Step 4: New session with working_directory=/var — verify create_session working directory again")
-        sid2 = sandbox.commands.create_session(working_directory="/var")
+        sid2 = cmds.create_session(working_directory="/var")
         assert sid2 is not None
-        out_var2 = sandbox.commands.run_in_session(sid2, "pwd")
+        out_var2 = cmds.run_in_session(sid2, "pwd")
         assert out_var2.error is None
         assert out_var2.exit_code == 0
         var2_line = "".join(m.text for m in out_var2.logs.stdout).strip()
@@ -951,49 +1013,51 @@ class TestSandboxE2ESync:
         logger.info("✓ create_session(working_directory=/var) applied: pwd => %s", var2_line)
 
         logger.info("Step 5: Delete both sessions")
-        sandbox.commands.delete_session(sid)
-        sandbox.commands.delete_session(sid2)
+        cmds.delete_session(sid)
+        cmds.delete_session(sid2)
         logger.info("✓ Sessions deleted")
 
         logger.info("TEST 2c PASSED: working directory passing verified for create_session and run_in_session (sync)")
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(3)
     def test_02a_command_status_and_logs(self) -> None:
         """Test command status + background logs (sync)."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
+        cmds = sandbox.commands
 
-        exec_result = sandbox.commands.run(
+        exec_result = cmds.run(
             "sh -c 'echo log-line-1; echo log-line-2; sleep 2'",
             opts=RunCommandOpts(background=True),
         )
         assert exec_result.id is not None
         command_id = exec_result.id
 
-        status = sandbox.commands.get_command_status(command_id)
+        status = cmds.get_command_status(command_id)
         assert status.id == command_id
         assert isinstance(status.running, bool)
 
-        logs_text = ""
+        # The cursor makes each read an incremental delta of whole lines, so only the
+        # newest chunk needs scanning; the chunks are joined once for the final asserts.
+        parts: list[str] = []
         cursor = None
-        for _ in range(20):
-            logs = sandbox.commands.get_background_command_logs(command_id, cursor=cursor)
-            logs_text += logs.content
+
+        def fetch_logs() -> str:
+            nonlocal cursor
+            logs = cmds.get_background_command_logs(command_id, cursor=cursor)
+            parts.append(logs.content)
             cursor = logs.cursor if logs.cursor is not None else cursor
-            if "log-line-2" in logs_text:
-                break
-            time.sleep(1.0)
+            return logs.content
+
+        _adaptive_poll(fetch_logs, lambda chunk: "log-line-2" in chunk)
+        logs_text = "".join(parts)
 
         assert "log-line-1" in logs_text
         assert "log-line-2" in logs_text
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(3)
     def test_02b_run_command_with_envs(self) -> None:
         """Test run_command env injection via RunCommandOpts.envs (sync)."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
@@ -1025,102 +1089,104 @@ class TestSandboxE2ESync:
         assert injected_output == env_value
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(4)
-    def test_03_basic_filesystem_operations(self) -> None:
+    def test_03_basic_filesystem_operations(self, request) -> None:
         """Test basic filesystem operations."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
+        # Shell-side checks share one bash session instead of spawning a shell per command.
+        sh = sandbox.commands.session(working_directory="/tmp")
+        sh.open()
+        request.addfinalizer(sh.close)
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 3: Testing basic filesystem operations (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         test_dir1 = f"/tmp/fs_test1_{int(time.time() * 1000)}"
         test_dir2 = f"/tmp/fs_test2_{int(time.time() * 1000)}"
 
         dir_entry1 = WriteEntry(path=test_dir1, mode=755)
         dir_entry2 = WriteEntry(path=test_dir2, mode=644)
-        sandbox.files.create_directories([dir_entry1, dir_entry2])
-
-        dir_info_map = sandbox.files.get_file_info([test_dir1, test_dir2])
-        assert test_dir1 in dir_info_map
-        assert test_dir2 in dir_info_map
-        assert dir_info_map[test_dir1].path == test_dir1
-        assert dir_info_map[test_dir2].path == test_dir2
-        assert dir_info_map[test_dir1].mode == 755
-        assert dir_info_map[test_dir2].mode == 644
-        assert dir_info_map[test_dir1].owner
-        assert dir_info_map[test_dir1].group
-        _assert_times_close(dir_info_map[test_dir1].created_at, dir_info_map[test_dir1].modified_at)
-
-        ls_result = sandbox.commands.run(
-            "ls -la | grep fs_test",
-            opts=RunCommandOpts(working_directory="/tmp"),
-        )
-        assert len(ls_result.logs.stdout) == 2
 
         test_file1 = f"{test_dir1}/test_file1.txt"
         test_file2 = f"{test_dir1}/test_file2.txt"
         test_file3 = f"{test_dir1}/test_file3.txt"
         test_content = "Hello Filesystem!\nLine 2 with special chars: åäö\nLine 3"
+        test_content_bytes = test_content.encode("utf-8")
+        expected_size = len(test_content_bytes)
 
         write_entry1 = WriteEntry(path=test_file1, data=test_content, mode=644)
-        write_entry2 = WriteEntry(path=test_file2, data=test_content.encode("utf-8"), mode=755)
+        write_entry2 = WriteEntry(path=test_file2, data=test_content_bytes, mode=755)
         write_entry3 = WriteEntry(
             path=test_file3,
-            data=BytesIO(test_content.encode("utf-8")),
+            data=BytesIO(test_content_bytes),
             group="nogroup",
             owner="nobody",
             mode=755,
         )
-        sandbox.files.write_files([write_entry1, write_entry2, write_entry3])
 
-        read_content1 = sandbox.files.read_file(test_file1, encoding="utf-8")
-        read_content1_partial = sandbox.files.read_file(
-            test_file1,
-            encoding="utf-8",
-            range_header="bytes=0-9",
+        sandbox.files.create_directories([dir_entry1, dir_entry2])
+        # The upload response carries each file's metadata, so no separate get_file_info.
+        file_info_map = sandbox.files.write_files_detailed([write_entry1, write_entry2, write_entry3])
+
+        # One stat call checks existence, mode and ownership of both directories.
+        stat_result = sh.run(f"stat -c '%n %a %U %G' {test_dir1} {test_dir2}")
+        assert stat_result.error is None
+        dir_stats = {}
+        for msg in stat_result.logs.stdout:
+            for line in msg.text.splitlines():
+                name, mode, owner, group = line.split()
+                dir_stats[name] = (mode, owner, group)
+        assert set(dir_stats) == {test_dir1, test_dir2}
+        assert dir_stats[test_dir1][0] == "755"
+        assert dir_stats[test_dir2][0] == "644"
+        assert dir_stats[test_dir1][1]
+        assert dir_stats[test_dir1][2]
+
+        # The reads are independent, so they go out concurrently.
+        read_bytes1, read_bytes1_partial, read_bytes2 = sandbox.files.read_many(
+            [
+                ReadEntry(path=test_file1),
+                ReadEntry(path=test_file1, range_header="bytes=0-9"),
+                ReadEntry(path=test_file2),
+            ]
         )
-        read_bytes2 = sandbox.files.read_bytes(test_file2)
+        read_content1 = read_bytes1.decode("utf-8")
+        read_content1_partial = read_bytes1_partial.decode("utf-8")
         read_content2 = read_bytes2.decode("utf-8")
 
-        stream3 = sandbox.files.read_bytes_stream(test_file3)
-        read_content3_bytes = b""
-        for chunk in stream3:
-            read_content3_bytes += chunk
-        read_content3 = read_content3_bytes.decode("utf-8")
+        stream3 = sandbox.files.read_bytes_stream(test_file3, chunk_size=1 << 20)
+        read_content3 = stream3.read_all().decode("utf-8")
 
-        expected_size = len(test_content.encode("utf-8"))
         assert read_content1 == test_content
         assert read_content2 == test_content
         assert read_content3 == test_content
         assert read_content1_partial == test_content[:10]
 
-        file_info_map = sandbox.files.get_file_info([test_file1, test_file2, test_file3])
-        file_info1 = file_info_map[test_file1]
-        assert file_info1.path == test_file1
-        assert file_info1.size == expected_size
-        assert file_info1.mode == 644
-        assert file_info1.owner is not None
-        assert file_info1.group is not None
-        _assert_times_close(file_info1.created_at, file_info1.modified_at)
-
-        file_info2 = file_info_map[test_file2]
-        assert file_info2.path == test_file2
-        assert file_info2.size == expected_size
-        assert file_info2.mode == 755
-        assert file_info2.owner is not None
-        assert file_info2.group is not None
-        _assert_times_close(file_info2.created_at, file_info2.modified_at)
-
-        file_info3 = file_info_map[test_file3]
-        assert file_info3.path == test_file3
-        assert file_info3.size == expected_size
-        assert file_info3.mode == 755
-        assert file_info3.owner == "nobody"
-        assert file_info3.group == "nogroup"
-        _assert_times_close(file_info3.created_at, file_info3.modified_at)
+        # Owner/group are only pinned for file3; for the others just check they are set.
+        actual = {
+            path: {
+                "path": info.path,
+                "size": info.size,
+                "mode": info.mode,
+                "owner": info.owner if path == test_file3 else bool(info.owner),
+                "group": info.group if path == test_file3 else bool(info.group),
+            }
+            for path, info in file_info_map.items()
+        }
+        assert actual == {
+            test_file1: {"path": test_file1, "size": expected_size, "mode": 644, "owner": True, "group": True},
+            test_file2: {"path": test_file2, "size": expected_size, "mode": 755, "owner": True, "group": True},
+            test_file3: {
+                "path": test_file3,
+                "size": expected_size,
+                "mode": 755,
+                "owner": "nobody",
+                "group": "nogroup",
+            },
+        }
+        for info in file_info_map.values():
+            assert_times_close(info.created_at, info.modified_at)
 
         search_all_entry = SearchEntry(path=test_dir1, pattern="*")
         all_files_list = sandbox.files.search(search_all_entry)
@@ -1130,7 +1196,7 @@ class TestSandboxE2ESync:
         assert test_file2 in all_files
         assert test_file3 in all_files
         assert all_files[test_file1].size == expected_size
-        _assert_times_close(all_files[test_file1].created_at, all_files[test_file1].modified_at)
+        assert_times_close(all_files[test_file1].created_at, all_files[test_file1].modified_at)
 
         perm_entry1 = SetPermissionEntry(path=test_file1, mode=755, owner="nobody", group="nogroup")
         perm_entry2 = SetPermissionEntry(path=test_file2, mode=600, owner="nobody", group="nogroup")
@@ -1148,23 +1214,24 @@ class TestSandboxE2ESync:
 
         before_update_info = sandbox.files.get_file_info([test_file1])[test_file1]
         updated_content1 = test_content + "\nAppended line to file1"
+        updated_content1_bytes = updated_content1.encode("utf-8")
         updated_content2 = test_content + "\nAppended line to file2"
         time.sleep(0.05)
-        sandbox.files.write_files(
+        # The upload response carries the post-write metadata; no separate get_file_info.
+        after_update_info = sandbox.files.write_files_detailed(
             [
                 WriteEntry(path=test_file1, data=updated_content1, mode=644),
                 WriteEntry(path=test_file2, data=updated_content2, mode=755),
             ]
-        )
+        )[test_file1]
 
         new_content1 = sandbox.files.read_file(test_file1, encoding="utf-8")
         new_content2 = sandbox.files.read_file(test_file2, encoding="utf-8")
         assert new_content1 == updated_content1
         assert new_content2 == updated_content2
 
-        after_update_info = sandbox.files.get_file_info([test_file1])[test_file1]
-        assert after_update_info.size == len(updated_content1.encode("utf-8"))
-        _assert_modified_updated(before_update_info.modified_at, after_update_info.modified_at, min_delta_ms=1)
+        assert after_update_info.size == len(updated_content1_bytes)
+        assert_modified_updated(before_update_info.modified_at, after_update_info.modified_at, min_delta_ms=1)
 
         # Replace file contents via API (replace_contents)
         before_replace_info = after_update_info
@@ -1184,8 +1251,8 @@ class TestSandboxE2ESync:
         replaced_content1 = sandbox.files.read_file(test_file1, encoding="utf-8")
         assert "Replaced line in file1" in replaced_content1
         assert "Appended line to file1" not in replaced_content1
-        after_replace_info = sandbox.files.get_file_info([test_file1])[test_file1]
-        _assert_modified_updated(before_replace_info.modified_at, after_replace_info.modified_at, min_delta_ms=1)
+        assert replace_results[0].size == len(replaced_content1.encode("utf-8"))
+        assert_modified_updated(before_replace_info.modified_at, replace_results[0].modified_at, min_delta_ms=1)
 
         # Replace with no match (replacedCount=0)
         no_match_results = sandbox.files.replace_contents_detailed([
@@ -1228,7 +1295,10 @@ class TestSandboxE2ESync:
         assert sandbox.files.read_file(batch_file_a, encoding="utf-8") == "hi world"
         assert sandbox.files.read_file(batch_file_b, encoding="utf-8") == "hi hi"
 
-        sandbox.files.delete_files([multi_match_file, batch_file_a, batch_file_b])
+        # Delete files via API (delete_files); test_file2 rides along with the scratch files.
+        sandbox.files.delete_files([multi_match_file, batch_file_a, batch_file_b, test_file2])
+        with pytest.raises(Exception):
+            sandbox.files.read_file(test_file2, encoding="utf-8")
 
         # Verify original replace_contents (no return value) still works
         sandbox.files.replace_contents([
@@ -1244,42 +1314,25 @@ class TestSandboxE2ESync:
         with pytest.raises(Exception):
             sandbox.files.read_bytes(test_file3)
 
-        # Delete file via API (delete_files)
-        sandbox.files.delete_files([test_file2])
-        with pytest.raises(Exception):
-            sandbox.files.read_file(test_file2, encoding="utf-8")
-
         files_after = sandbox.files.search(SearchEntry(path=test_dir1, pattern="*"))
         assert {e.path for e in files_after} == {test_file1}
 
         # Delete directories recursively (delete_directories)
         sandbox.files.delete_directories([test_dir1, test_dir2])
-        verify_dirs_deleted = sandbox.commands.run(
-            f"test ! -d {test_dir1} && test ! -d {test_dir2} && echo OK",
-            opts=RunCommandOpts(working_directory="/tmp"),
+        verify_dirs_deleted = _adaptive_poll(
+            lambda: sh.run(f"test ! -e {test_dir1} -a ! -e {test_dir2} && echo OK"),
+            lambda r: r.error is None
+            and len(r.logs.stdout) == 1
+            and r.logs.stdout[0].text == "OK",
+            budget_ms=3_000,
         )
-        for _ in range(3):
-            verified = (
-                verify_dirs_deleted.error is None
-                and len(verify_dirs_deleted.logs.stdout) == 1
-                and verify_dirs_deleted.logs.stdout[0].text == "OK"
-            )
-            if verified:
-                break
-            time.sleep(1)
-            verify_dirs_deleted = sandbox.commands.run(
-                f"test ! -d {test_dir1} && test ! -d {test_dir2} && echo OK",
-                opts=RunCommandOpts(working_directory="/tmp"),
-            )
         assert verify_dirs_deleted.error is None
         assert len(verify_dirs_deleted.logs.stdout) == 1
         assert verify_dirs_deleted.logs.stdout[0].text == "OK"
 
     @pytest.mark.timeout(60)
-    @pytest.mark.order(4)
     def test_03a_line_based_file_reading(self) -> None:
         """Test line-based file reading with offset and limit."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
@@ -1302,16 +1355,14 @@ class TestSandboxE2ESync:
         sandbox.files.delete_files([test_path])
 
     @pytest.mark.timeout(360)
-    @pytest.mark.order(5)
     def test_04_interrupt_command(self) -> None:
         """Test interrupting a long-running command."""
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 4: Testing command interrupt (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         init_events: list[ExecutionInit] = []
         completed_events: list[ExecutionComplete] = []
@@ -1335,19 +1386,16 @@ class TestSandboxE2ESync:
         )
 
         start = time.time()
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            future = ex.submit(
-                sandbox.commands.run,
-                "sleep 30",
-                handlers=handlers,
-            )
-            assert init_received.wait(timeout=15), "Execution init event was not received within 15s"
-            assert len(init_events) == 1
-            assert init_events[0].id is not None and init_events[0].id.strip()
-            _assert_recent_timestamp_ms(init_events[0].timestamp)
+        pool = TestSandboxE2ESync._pool
+        assert pool is not None
+        future = pool.submit(sandbox.commands.run, "sleep 30", handlers=handlers)
+        assert init_received.wait(timeout=15), "Execution init event was not received within 15s"
+        assert len(init_events) == 1
+        assert init_events[0].id is not None and init_events[0].id.strip()
+        assert_recent_timestamp_ms(init_events[0].timestamp)
 
-            sandbox.commands.interrupt(init_events[0].id)
-            execution = future.result(timeout=30)
+        sandbox.commands.interrupt(init_events[0].id)
+        execution = future.result(timeout=30)
 
         elapsed = time.time() - start
         assert execution is not None
@@ -1359,82 +1407,66 @@ class TestSandboxE2ESync:
         )
         if len(completed_events) > 0:
             assert len(completed_events) == 1
-            _assert_recent_timestamp_ms(completed_events[0].timestamp, tolerance_ms=180_000)
+            assert_recent_timestamp_ms(completed_events[0].timestamp, tolerance_ms=180_000)
         assert execution.error is not None or len(execution.logs.stderr) > 0
         if execution.error is not None:
             assert execution.error.name
             assert execution.error.value
-            _assert_recent_timestamp_ms(execution.error.timestamp, tolerance_ms=180_000)
+            assert_recent_timestamp_ms(execution.error.timestamp, tolerance_ms=180_000)
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(6)
+    # Pausing freezes the shared sandbox, so pause/resume run after every other test.
+    @pytest.mark.order(-2)
     def test_05_sandbox_pause(self) -> None:
         pytest.skip("skip pause/resume e2e test")
         """Test sandbox pause operation."""
         if is_kubernetes_runtime():
             pytest.skip("Pause is not supported by the Kubernetes runtime")
 
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 5: Testing sandbox pause operation (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
-        # Sandbox has been exercised through tests 01-04; a brief settle is sufficient.
-        time.sleep(2)
-        assert sandbox.is_healthy(), "Sandbox should be healthy before pause"
+        # Sandbox has been exercised through tests 01-04; poll briefly instead of a fixed settle.
+        healthy = _adaptive_poll(sandbox.is_healthy, bool, budget_ms=2_000)
+        assert healthy, "Sandbox should be healthy before pause"
 
         sandbox.pause()
 
-        poll_count = 0
-        final_status = None
-        while poll_count < 30:
-            time.sleep(1)
-            poll_count += 1
-            info = sandbox.get_info()
-            current_status = info.status
-            logger.info("Poll %s: Status = %s", poll_count, current_status.state)
-            if current_status.state == "Pausing":
-                continue
-            final_status = current_status
-            break
-
-        assert final_status is not None
-        assert final_status.state == "Paused"
+        info = sandbox.wait_for_state("Paused", timeout=timedelta(seconds=30))
+        assert info.status.state == "Paused"
 
         # Verify pause semantics: execd should be unreachable.
         # The global HTTP request_timeout is 3 min, so we run the single
         # is_healthy() call in a thread with a short timeout.  A paused
         # container's frozen process will never reply, causing either a
         # timeout (good) or an immediate connection refusal (also good).
-        # NOTE: shutdown(wait=False) so we don't block on the lingering
-        # HTTP request after our 15 s deadline.
-        pool = ThreadPoolExecutor(max_workers=1)
+        # The probe runs on its own daemon thread rather than the class pool: the
+        # lingering HTTP request after our 15 s deadline would otherwise hold a
+        # pool worker and stall the class teardown's shutdown(wait=True).
         try:
-            healthy = pool.submit(sandbox.is_healthy).result(timeout=15)
+            healthy = _run_in_thread(sandbox.is_healthy).result(timeout=15)
         except Exception:
             healthy = False
-        finally:
-            pool.shutdown(wait=False)
         assert healthy is False, "Sandbox should be unhealthy after pause"
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(7)
+    @pytest.mark.order(-1)
     def test_06_sandbox_resume(self) -> None:
         pytest.skip("skip pause/resume e2e test")
         """Test sandbox resume operation."""
         if is_kubernetes_runtime():
             pytest.skip("Resume is not supported by the Kubernetes runtime")
 
-        TestSandboxE2ESync._ensure_sandbox_created()
         sandbox = TestSandboxE2ESync.sandbox
         assert sandbox is not None
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("TEST 6: Testing sandbox resume operation (sync)")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         resumed = SandboxSync.resume(
             sandbox_id=sandbox.id,
@@ -1443,27 +1475,11 @@ class TestSandboxE2ESync:
         TestSandboxE2ESync.sandbox = resumed
         sandbox = resumed
 
-        poll_count = 0
-        final_status = None
-        while poll_count < 60:
-            time.sleep(1)
-            poll_count += 1
-            info = sandbox.get_info()
-            current_status = info.status
-            logger.info("Poll %s: Status = %s", poll_count, current_status.state)
-            if current_status.state == "Running":
-                final_status = current_status
-                break
-
-        assert final_status is not None
-        assert final_status.state == "Running"
-        healthy = False
-        for _ in range(30):
-            healthy = sandbox.is_healthy()
-            if healthy:
-                break
-            time.sleep(1)
-        assert healthy is True, "Sandbox should be healthy after resume"
+        info = sandbox.wait_for_state("Running", timeout=timedelta(seconds=60))
+        assert info.status.state == "Running"
+        # Raises SandboxReadyTimeoutException if execd does not answer within 30s.
+        sandbox.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(milliseconds=200))
+        assert sandbox.is_healthy() is True, "Sandbox should be healthy after resume"
 
         # Minimal smoke check: after resume, the existing SandboxSync instance should still be usable.
         echo = sandbox.commands.run("echo resume-ok")
@@ -1472,7 +1488,6 @@ class TestSandboxE2ESync:
         assert echo.logs.stdout[0].text == "resume-ok"
 
     @pytest.mark.timeout(120)
-    @pytest.mark.order(8)
     def test_07_x_request_id_passthrough_on_server_error(self) -> None:
         request_id = f"e2e-py-sync-server-{int(time.time() * 1000)}"
         missing_sandbox_id = f"missing-{request_id}"